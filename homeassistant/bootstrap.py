@@ -69,6 +69,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -87,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -96,6 +97,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_import_timings,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -244,6 +246,21 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+#
+# The integrations resolved on the previous start are stored so their
+# manifests can be loaded in a single batch on the next start instead
+# of one batch per level of dependencies.
+#
+INTEGRATION_SNAPSHOT_STORAGE_KEY = "core.integration_snapshot"
+INTEGRATION_SNAPSHOT_STORAGE_VERSION = 1
+
+#
+# The time each integration took to import on the previous start,
+# used to start the most expensive imports first.
+#
+IMPORT_TIMINGS_STORAGE_KEY = "core.import_timings"
+IMPORT_TIMINGS_STORAGE_VERSION = 1
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -765,6 +782,44 @@ async def async_setup_multi_components(
             )
 
 
+def _integration_snapshot_domains(
+    snapshot: Any, requested: list[str]
+) -> list[str] | None:
+    """Return the domains of the integration snapshot if it can be used.
+
+    A snapshot of another version, of other requested domains or
+    that is not in the expected shape is ignored.
+    """
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("ha_version") != __version__
+        or snapshot.get("requested") != requested
+        or not isinstance(domains := snapshot.get("domains"), list)
+        or not all(isinstance(domain, str) for domain in domains)
+    ):
+        return None
+    return domains
+
+
+def _stored_import_timings(stored: Any) -> dict[str, float]:
+    """Return the stored import timings if they can be used.
+
+    Timings of another version or that are not in the expected
+    shape are ignored.
+    """
+    if (
+        not isinstance(stored, dict)
+        or stored.get("ha_version") != __version__
+        or not isinstance(timings := stored.get("timings"), dict)
+        or not all(
+            isinstance(domain, str) and type(timing) in (float, int)
+            for domain, timing in timings.items()
+        )
+    ):
+        return {}
+    return timings
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -805,6 +860,20 @@ async def _async_resolve_domains_to_setup(
 
     translations_to_load = additional_manifests_to_load.copy()
 
+    start = monotonic()
+    snapshot_store: Store[dict[str, Any]] = Store(
+        hass, INTEGRATION_SNAPSHOT_STORAGE_VERSION, INTEGRATION_SNAPSHOT_STORAGE_KEY
+    )
+    requested = sorted(domains_to_setup | additional_manifests_to_load)
+    if (
+        snapshot_domains := _integration_snapshot_domains(
+            await snapshot_store.async_load(), requested
+        )
+    ) is not None:
+        # The snapshot is only used to load the manifests ahead of time,
+        # the dependencies are still resolved below from the manifests.
+        await loader.async_get_integrations(hass, snapshot_domains)
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
@@ -878,6 +947,24 @@ async def _async_resolve_domains_to_setup(
                 to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
+    _LOGGER.info(
+        "Resolved integrations in %.2fs %s the integration snapshot",
+        monotonic() - start,
+        "without" if snapshot_domains is None else "with",
+    )
+
+    if (resolved := sorted(integration_cache)) != snapshot_domains:
+        hass.async_create_background_task(
+            snapshot_store.async_save(
+                {
+                    "ha_version": __version__,
+                    "requested": requested,
+                    "domains": resolved,
+                }
+            ),
+            "save integration snapshot",
+            eager_start=True,
+        )
 
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
@@ -923,6 +1010,46 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_import_integration(
+    hass: core.HomeAssistant, integration: loader.Integration
+) -> None:
+    """Import an integration ahead of its setup once its requirements are met."""
+    try:
+        await requirements.async_process_requirements(
+            hass, integration.domain, integration.requirements
+        )
+        await integration.async_get_component()
+    except Exception:  # noqa: BLE001
+        # The error will be reported when the integration is set up
+        _LOGGER.debug("Failed to import %s ahead of setup", integration.domain)
+
+
+@core.callback
+def _async_start_imports_by_cost(
+    hass: core.HomeAssistant,
+    integrations: list[loader.Integration],
+    import_timings: dict[str, float],
+) -> None:
+    """Start importing integrations, the most expensive first.
+
+    Only integrations that were imported on the previous start of the
+    same version are imported ahead of their setup.
+    """
+    for integration in sorted(
+        (
+            integration
+            for integration in integrations
+            if integration.import_executor and integration.domain in import_timings
+        ),
+        key=lambda integration: -import_timings[integration.domain],
+    ):
+        hass.async_create_background_task(
+            _async_import_integration(hass, integration),
+            f"import {integration.domain}",
+            eager_start=True,
+        )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -933,6 +1060,12 @@ async def _async_set_up_integrations(
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
+    import_timings_store: Store[dict[str, Any]] = Store(
+        hass, IMPORT_TIMINGS_STORAGE_VERSION, IMPORT_TIMINGS_STORAGE_KEY
+    )
+    # Timings of another version are not used since the
+    # integrations and their requirements may have changed
+    import_timings = _stored_import_timings(await import_timings_store.async_load())
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -980,6 +1113,20 @@ async def _async_set_up_integrations(
             async_set_domains_to_be_loaded(hass, to_be_loaded)
             await async_setup_multi_components(hass, domain_group, config)
 
+    # Import the stage 1 and then the stage 2 integrations while the
+    # earlier ones are validating their config and setting up. The
+    # import executor runs the jobs in the order they are started.
+    for stage_domains in (stage_1_domains, stage_2_domains):
+        _async_start_imports_by_cost(
+            hass,
+            [
+                integration
+                for domain in stage_domains
+                if (integration := integration_cache.get(domain)) is not None
+            ],
+            import_timings,
+        )
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -1026,9 +1173,22 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    new_import_timings = async_get_import_timings(hass)
+    hass.async_create_background_task(
+        import_timings_store.async_save(
+            {"ha_version": __version__, "timings": new_import_timings}
+        ),
+        "save import timings",
+        eager_start=True,
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(new_import_timings.items(), key=itemgetter(1), reverse=True)),
+        )
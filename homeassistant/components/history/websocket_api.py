@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -36,14 +39,19 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
 
+# default and maximum number of states in a page
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+
 
 @dataclass(slots=True)
 class HistoryLiveStream:
@@ -60,6 +68,7 @@ class HistoryLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_history_page)
     websocket_api.async_register_command(hass, ws_stream)
 
 
@@ -94,6 +103,52 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    cancel: threading.Event,
+) -> None:
+    """Fetch history significant_states and send them in chunks in the executor.
+
+    Each chunk is handed to the event loop before the next one is
+    read from the database so only one chunk is held in memory. The
+    rest of the range is not read once cancel is set.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = history.iter_significant_states_chunks(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        )
+        try:
+            for states in chunks:
+                if cancel.is_set():
+                    break
+                run_callback_threadsafe(
+                    hass.loop,
+                    connection.send_message,
+                    json_bytes(messages.event_message(msg_id, {"states": states})),
+                ).result()
+        finally:
+            chunks.close()
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,13 +159,19 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    If chunk_size is set the states are sent in event messages of
+    about chunk_size states each, the states of an entity may span
+    several messages. The empty result message is sent last.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -156,6 +217,36 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_size := msg.get("chunk_size"):
+        # Stop reading the database when the connection is closed
+        # while the chunks are still being sent
+        cancel = threading.Event()
+        connection.subscriptions[msg["id"]] = cancel.set
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                connection,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+                cancel,
+            )
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+        finally:
+            connection.subscriptions.pop(msg["id"], None)
+        if not cancel.is_set():
+            connection.send_result(msg["id"], {})
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -172,6 +263,133 @@ async def ws_get_history_during_period(
     )
 
 
+def _encode_page_cursor(keyset: tuple[float, int]) -> str:
+    """Encode the keyset of the next page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json_bytes(list(keyset))).decode()
+
+
+def _decode_page_cursor(cursor: str) -> tuple[float, int] | None:
+    """Decode an opaque cursor to a keyset, return None if it is invalid."""
+    try:
+        keyset = json_loads(base64.urlsafe_b64decode(cursor))
+    except ValueError:
+        return None
+    match keyset:
+        case [float() | int() as last_updated_ts, int() as state_id]:
+            pass
+        case _:
+            return None
+    if any(isinstance(value, bool) for value in keyset):
+        return None
+    return float(last_updated_ts), state_id
+
+
+def _ws_get_state_changes_page(
+    hass: HomeAssistant,
+    msg_id: int,
+    entity_id: str,
+    start_time: dt,
+    keyset: tuple[float, int] | None,
+    limit: int,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch a page of state changes and convert it to json in the executor."""
+    with session_scope(hass=hass, read_only=True) as session:
+        states, next_keyset = history.get_state_changes_page(
+            hass,
+            session,
+            entity_id,
+            start_time,
+            keyset,
+            limit,
+            significant_changes_only,
+            no_attributes,
+        )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                "states": states,
+                "next_cursor": next_keyset and _encode_page_cursor(next_keyset),
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_page",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("cursor"): str,
+        vol.Optional("limit", default=DEFAULT_PAGE_SIZE): vol.All(
+            int, vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+        vol.Required("entity_id"): str,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_page(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history page websocket command.
+
+    Returns the newest state changes of an entity before end_time, or
+    before the cursor returned with the previous page, and the cursor
+    of the next page which is None once start_time has been reached.
+    """
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+    entity_id: str = msg["entity_id"]
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    keyset: tuple[float, int] | None = None
+    if cursor := msg.get("cursor"):
+        if (keyset := _decode_page_cursor(cursor)) is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+    elif end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            # No state has a state_id of 0 so only the states
+            # before the end time are included
+            keyset = (dt_util.utc_to_timestamp(dt_util.as_utc(end_time)), 0)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+
+    if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+        connection.send_error(msg["id"], "invalid_entity_id", "Invalid entity_id")
+        return
+
+    if start_time > dt_util.utcnow() or (
+        keyset is not None and start_time.timestamp() >= keyset[0]
+    ):
+        connection.send_result(msg["id"], {"states": [], "next_cursor": None})
+        return
+
+    connection.send_message(
+        await get_instance(hass).async_add_executor_job(
+            _ws_get_state_changes_page,
+            hass,
+            msg["id"],
+            entity_id,
+            start_time,
+            keyset,
+            msg["limit"],
+            msg["significant_changes_only"],
+            msg["no_attributes"],
+        )
+    )
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from itertools import chain
 import logging
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
@@ -67,6 +68,9 @@ from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_even
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
+# The smallest time window read to fill a page of events
+MIN_PAGE_WINDOW = timedelta(minutes=1)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -144,6 +148,10 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return self.humanify(self._get_rows(start_day, end_day))
+
+    def _get_rows(self, start_day: dt, end_day: dt) -> Sequence[Row]:
+        """Get the rows for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -168,10 +176,90 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            return cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
             )
 
+    def get_events_page(
+        self,
+        start_day: dt,
+        before: tuple[float, int, int],
+        limit: int,
+        window: timedelta,
+    ) -> tuple[list[dict[str, Any]], tuple[float, int, int, timedelta] | None]:
+        """Get the newest limit events after start_day before a keyset.
+
+        The keyset is the page key of the row of the oldest event of the
+        previous page. Time windows that double in size are read backwards
+        from the keyset until they hold enough events for the page. The
+        rows of all the windows are then converted oldest first in one
+        pass, so the context of an entry is found even when it started in
+        an older window. The time covered by the page is returned with the
+        next keyset as the window to start the next page with.
+
+        Requires a processor that formats times as timestamps.
+        """
+        before_ts = before[0]
+        bound_ts = before_ts
+        windows: list[list[Row]] = []
+        found = 0
+        while True:
+            bound = dt_util.utc_from_timestamp(bound_ts)
+            window_start = max(start_day, bound - window)
+            # The window start is exclusive, so the end of the next
+            # window includes the rows at the window start
+            window_rows = sorted(
+                (
+                    row
+                    for row in self._get_rows(
+                        window_start, bound + timedelta(microseconds=1)
+                    )
+                    if row.time_fired_ts <= bound_ts and _row_page_key(row) < before
+                ),
+                key=_row_page_key,
+            )
+            windows.append(window_rows)
+            found += len(self.humanify(window_rows))
+            if found >= limit or window_start <= start_day:
+                break
+            bound_ts = dt_util.utc_to_timestamp(window_start)
+            window *= 2
+
+        context_lookup = self.logbook_run.context_lookup
+        context_lookup.clear()
+        context_lookup[None] = None
+        row_key = before
+
+        def _track_row_keys(rows: Iterable[Row]) -> Generator[Row, None, None]:
+            nonlocal row_key
+            for row in rows:
+                row_key = _row_page_key(row)
+                yield row
+
+        # An entry is made from the last row read from the rows
+        keyed_entries = [
+            (row_key, entry)
+            for entry in _humanify(
+                self.hass,
+                _track_row_keys(chain.from_iterable(reversed(windows))),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
+            )
+        ]
+        page = keyed_entries[-limit:]
+        entries = [entry for _, entry in page]
+        if not page or (window_start <= start_day and len(keyed_entries) <= limit):
+            return entries, None
+        oldest_ts, oldest_kind, oldest_row_id = page[0][0]
+        return entries, (
+            oldest_ts,
+            oldest_kind,
+            oldest_row_id,
+            max(timedelta(seconds=before_ts - oldest_ts), MIN_PAGE_WINDOW),
+        )
+
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -189,7 +277,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow | Row, None, None] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -388,6 +476,19 @@ def _row_time_fired_isoformat(row: Row | EventAsRow) -> str:
     )
 
 
+def _row_page_key(row: Row) -> tuple[float, int, int]:
+    """Return the key that orders the rows of a page.
+
+    Rows fired at the same time are ordered events before states and
+    then by their row id, so the order does not depend on the query.
+    """
+    return (
+        row.time_fired_ts,
+        int(row.event_type is PSEUDO_EVENT_STATE_CHANGED),
+        row.row_id,
+    )
+
+
 def _row_time_fired_timestamp(row: Row | EventAsRow) -> float:
     """Convert the row timed_fired to timestamp."""
     return row.time_fired_ts or process_datetime_to_timestamp(dt_util.utcnow())
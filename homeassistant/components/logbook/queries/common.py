@@ -5,10 +5,10 @@ from __future__ import annotations
 from typing import Final
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CTE, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -142,6 +142,47 @@ def select_states_context_only() -> Select:
     )
 
 
+def select_events_context_origins(context_ids: CTE) -> Select:
+    """Generate a query for the first event of each context in context_ids.
+
+    Only the first row of a context is used to augment the logbook
+    entries, so the events of each context are reduced to the oldest
+    one using only the context_id_bin index before the rows are joined.
+    """
+    origins = apply_events_context_hints(
+        select(func.min(Events.event_id).label("event_id"))
+        .select_from(context_ids)
+        .join(Events, context_ids.c.context_id_bin == Events.context_id_bin)
+        .group_by(Events.context_id_bin)
+    ).subquery()
+    return (
+        select_events_context_only()
+        .select_from(origins)
+        .join(Events, Events.event_id == origins.c.event_id)
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+    )
+
+
+def select_states_context_origins(context_ids: CTE) -> Select:
+    """Generate a query for the first state of each context in context_ids.
+
+    See select_events_context_origins for why only the first state is selected.
+    """
+    origins = apply_states_context_hints(
+        select(func.min(States.state_id).label("state_id"))
+        .select_from(context_ids)
+        .join(States, context_ids.c.context_id_bin == States.context_id_bin)
+        .group_by(States.context_id_bin)
+    ).subquery()
+    return (
+        select_states_context_only()
+        .select_from(origins)
+        .join(States, States.state_id == origins.c.state_id)
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+    )
+
+
 def select_events_without_states(
     start_day: float, end_day: float, event_type_ids: tuple[int, ...]
 ) -> Select:
@@ -10,22 +10,13 @@ from sqlalchemy.sql.elements import BooleanClauseList
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 
-from homeassistant.components.recorder.db_schema import (
-    DEVICE_ID_IN_EVENT,
-    EventData,
-    Events,
-    EventTypes,
-    States,
-    StatesMeta,
-)
+from homeassistant.components.recorder.db_schema import DEVICE_ID_IN_EVENT, Events
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_origins,
     select_events_without_states,
-    select_states_context_only,
+    select_states_context_origins,
 )
 
 
@@ -59,19 +50,8 @@ def _apply_devices_context_union(
         json_quotable_device_ids,
     ).cte()
     return sel.union_all(
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_cte)
-            .outerjoin(Events, devices_cte.c.context_id_bin == Events.context_id_bin)
-            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-            .outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        ),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_cte)
-            .outerjoin(States, devices_cte.c.context_id_bin == States.context_id_bin)
-            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
-        ),
+        select_events_context_origins(devices_cte),
+        select_states_context_origins(devices_cte),
     )
 
 
@@ -14,22 +14,17 @@ from homeassistant.components.recorder.db_schema import (
     ENTITY_ID_IN_EVENT,
     METADATA_ID_LAST_UPDATED_INDEX_TS,
     OLD_ENTITY_ID_IN_EVENT,
-    EventData,
     Events,
-    EventTypes,
     States,
-    StatesMeta,
 )
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     apply_states_filters,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_origins,
     select_events_without_states,
     select_states,
-    select_states_context_only,
+    select_states_context_origins,
 )
 
 
@@ -77,19 +72,8 @@ def _apply_entities_context_union(
     # set on them the impact is minimal.
     return sel.union_all(
         states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(entities_cte)
-            .outerjoin(Events, entities_cte.c.context_id_bin == Events.context_id_bin)
-            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-            .outerjoin(EventData, (Events.data_id == EventData.data_id))
-        ),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(entities_cte)
-            .outerjoin(States, entities_cte.c.context_id_bin == States.context_id_bin)
-            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
-        ),
+        select_events_context_origins(entities_cte),
+        select_states_context_origins(entities_cte),
     )
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
@@ -20,6 +21,7 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
 from .helpers import (
@@ -28,7 +30,7 @@ from .helpers import (
     async_subscribe_events,
 )
 from .models import LogbookConfig, async_event_to_row
-from .processor import EventProcessor
+from .processor import MIN_PAGE_WINDOW, EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -36,6 +38,9 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# default and maximum number of events in a page
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +60,7 @@ class LogbookLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
     websocket_api.async_register_command(hass, ws_get_events)
+    websocket_api.async_register_command(hass, ws_get_events_page)
     websocket_api.async_register_command(hass, ws_event_stream)
 
 
@@ -520,3 +526,156 @@ async def ws_get_events(
             event_processor,
         )
     )
+
+
+def _encode_page_cursor(keyset: tuple[float, int, int, timedelta]) -> str:
+    """Encode the keyset of the next page as an opaque cursor."""
+    before_ts, kind, row_id, window = keyset
+    return base64.urlsafe_b64encode(
+        json_bytes([before_ts, kind, row_id, window.total_seconds()])
+    ).decode()
+
+
+def _decode_page_cursor(cursor: str) -> tuple[float, int, int, timedelta] | None:
+    """Decode an opaque cursor to a keyset, return None if it is invalid."""
+    try:
+        keyset = json_loads(base64.urlsafe_b64decode(cursor))
+    except ValueError:
+        return None
+    match keyset:
+        case [
+            float()
+            | int() as before_ts,
+            int() as kind,
+            int() as row_id,
+            float()
+            | int() as window,
+        ]:
+            pass
+        case _:
+            return None
+    if (
+        any(isinstance(value, bool) for value in keyset)
+        or kind not in (0, 1)
+        or row_id < 0
+    ):
+        return None
+    # The window of a page never reaches back before the epoch
+    if not MIN_PAGE_WINDOW.total_seconds() <= window <= before_ts:
+        return None
+    try:
+        dt_util.utc_from_timestamp(before_ts)
+    except (OverflowError, ValueError, OSError):
+        return None
+    return float(before_ts), kind, row_id, timedelta(seconds=window)
+
+
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    keyset: tuple[float, int, int, timedelta],
+    limit: int,
+    event_processor: EventProcessor,
+) -> bytes:
+    """Fetch a page of events and convert it to json in the executor."""
+    before_ts, kind, row_id, window = keyset
+    events, next_keyset = event_processor.get_events_page(
+        start_time, (before_ts, kind, row_id), limit, window
+    )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "next_cursor": next_keyset and _encode_page_cursor(next_keyset),
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/get_events_page",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("cursor"): str,
+        vol.Optional("limit", default=DEFAULT_PAGE_SIZE): vol.All(
+            int, vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("device_ids"): [str],
+        vol.Optional("context_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_get_events_page(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle logbook get events page websocket command.
+
+    Returns the newest events before end_time, or before the cursor
+    returned with the previous page, and the cursor of the next page
+    which is None once start_time has been reached.
+    """
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+    empty_page: dict[str, Any] = {"events": [], "next_cursor": None}
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if cursor := msg.get("cursor"):
+        if (keyset := _decode_page_cursor(cursor)) is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+    else:
+        if not end_time_str:
+            end_time = dt_util.utcnow()
+        elif parsed_end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(parsed_end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+        # The end time is exclusive and no row sorts before the
+        # keyset of the end time with a kind and row id of 0
+        keyset = (dt_util.utc_to_timestamp(end_time), 0, 0, MIN_PAGE_WINDOW)
+
+    if start_time.timestamp() >= keyset[0]:
+        connection.send_result(msg["id"], empty_page)
+        return
+
+    device_ids = msg.get("device_ids")
+    entity_ids = msg.get("entity_ids")
+    context_id = msg.get("context_id")
+    if entity_ids:
+        entity_ids = async_filter_entities(hass, entity_ids)
+        if not entity_ids and not device_ids:
+            # Everything has been filtered away
+            connection.send_result(msg["id"], empty_page)
+            return
+
+    event_types = async_determine_event_types(hass, entity_ids, device_ids)
+
+    event_processor = EventProcessor(
+        hass,
+        event_types,
+        entity_ids,
+        device_ids,
+        context_id,
+        timestamp=True,
+        include_entity_name=False,
+    )
+
+    connection.send_message(
+        await get_instance(hass).async_add_executor_job(
+            _ws_formatted_get_events_page,
+            msg["id"],
+            start_time,
+            keyset,
+            msg["limit"],
+            event_processor,
+        )
+    )
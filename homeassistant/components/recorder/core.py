@@ -16,7 +16,14 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -84,6 +91,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.hot_cache import HistoryHotCache
 from .migration import (
     EntityIDMigration,
     EventsContextIDMigration,
@@ -180,6 +188,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool = False,
+        history_cache_size: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -193,6 +203,11 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        self.history_hot_cache: HistoryHotCache | None = (
+            HistoryHotCache(history_cache_size) if history_cache_size else None
+        )
+        self._pending_hot_cache_states: list[States] = []
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -219,6 +234,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -1086,6 +1102,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
+        event_data_manager.add_pending_reference(dbevent)
         self._add_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
@@ -1169,7 +1186,18 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        state_attributes_manager.add_pending_reference(dbstate)
+
+        if self._bulk_insert_states:
+            # The state is not added to the session, it will be
+            # written with a multi-row insert when the session is committed
+            self._event_session_has_pending_writes = True
+            self.states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
+        if self.history_hot_cache is not None:
+            self._pending_hot_cache_states.append(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1209,6 +1237,12 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_insert_states and (
+            pending_inserts := self.states_manager.get_pending_inserts()
+        ):
+            with session.no_autoflush:
+                _bulk_insert_states(session, pending_inserts)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1237,6 +1271,21 @@ class Recorder(threading.Thread):
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
 
+        if self._pending_hot_cache_states:
+            assert self.history_hot_cache is not None
+            self.history_hot_cache.add_states(
+                (
+                    metadata_id,
+                    dbstate.state,
+                    dbstate.last_updated_ts,
+                    dbstate.last_changed_ts,
+                )
+                for dbstate in self._pending_hot_cache_states
+                if (metadata_id := _metadata_id_for_state(dbstate)) is not None
+                and dbstate.last_updated_ts is not None
+            )
+            self._pending_hot_cache_states.clear()
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -1251,6 +1300,8 @@ class Recorder(threading.Thread):
         finally:
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
+        if self.history_hot_cache is not None:
+            self.history_hot_cache.clear()
         self.recorder_runs_manager.reset()
         self._setup_recorder()
         self._setup_run()
@@ -1258,6 +1309,7 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self._pending_hot_cache_states.clear()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1448,6 +1500,15 @@ class Recorder(threading.Thread):
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
+        self._bulk_insert_states = self.bulk_insert and bool(
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        if self.bulk_insert and not self._bulk_insert_states:
+            _LOGGER.warning(
+                "The %s database does not support multi-row inserts with RETURNING,"
+                " bulk_insert is disabled",
+                self.engine.dialect.name,
+            )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -1460,6 +1521,9 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        # The cached rows may not exist in the next database
+        if self.history_hot_cache is not None:
+            self.history_hot_cache.clear()
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1508,3 +1572,86 @@ class Recorder(threading.Thread):
         finally:
             self._stop_executor()
             self._close_connection()
+
+
+def _metadata_id_for_state(dbstate: States) -> int | None:
+    """Return the metadata_id of a state that may refer to a pending StatesMeta."""
+    if (metadata_id := dbstate.metadata_id) is None and (
+        states_meta := dbstate.states_meta_rel
+    ):
+        metadata_id = states_meta.metadata_id
+    return metadata_id
+
+
+def _bulk_insert_states(session: Session, pending_inserts: list[States]) -> None:
+    """Write the pending states with multi-row inserts.
+
+    The StatesMeta and StateAttributes rows are still added to the
+    session so they are flushed first to allocate their ids. The
+    States rows are then inserted in generations since a state can
+    refer to an older state of the same entity in the same commit
+    via old_state_id.
+
+    A state that was not queued, for example because its attributes
+    could not be serialized, is still the old_state of the next state
+    of its entity. It is inserted before that state, the same as the
+    ORM cascade does when the session is flushed.
+    """
+    session.flush()
+    generations: list[list[States]] = []
+    generation_by_state: dict[int, int] = {}
+    for pending_state in pending_inserts:
+        chain = [pending_state]
+        while (
+            (old_state := chain[-1].old_state) is not None
+            # state_id is only set once the row has been inserted
+            and not old_state.state_id
+            and id(old_state) not in generation_by_state
+        ):
+            chain.append(old_state)
+        for dbstate in reversed(chain):
+            generation = 0
+            if (old_state := dbstate.old_state) is not None and (
+                old_generation := generation_by_state.get(id(old_state))
+            ) is not None:
+                generation = old_generation + 1
+            generation_by_state[id(dbstate)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(dbstate)
+
+    stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+    for generation_states in generations:
+        result = session.execute(
+            stmt, [_bulk_insert_row(dbstate) for dbstate in generation_states]
+        )
+        for dbstate, state_id in zip(generation_states, result.scalars(), strict=True):
+            dbstate.state_id = state_id
+
+
+def _bulk_insert_row(dbstate: States) -> dict[str, Any]:
+    """Return the column values of a pending state for a bulk insert."""
+    metadata_id = _metadata_id_for_state(dbstate)
+    if (attributes_id := dbstate.attributes_id) is None and (
+        state_attributes := dbstate.state_attributes
+    ):
+        attributes_id = state_attributes.attributes_id
+    if (old_state_id := dbstate.old_state_id) is None and (
+        old_state := dbstate.old_state
+    ):
+        old_state_id = old_state.state_id
+    return {
+        "entity_id": dbstate.entity_id,
+        "state": dbstate.state,
+        "attributes": dbstate.attributes,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "origin_idx": dbstate.origin_idx,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
 
 from ... import recorder
 from ..filters import Filters
@@ -17,6 +19,8 @@ from .modern import (
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    get_state_changes_page as _modern_get_state_changes_page,
+    iter_significant_states_chunks as _modern_iter_significant_states_chunks,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +32,8 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "get_state_changes_page",
+    "iter_significant_states_chunks",
     "state_changes_during_period",
 ]
 
@@ -152,6 +158,91 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states_chunks(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_rows: int,
+) -> Generator[dict[str, list[dict[str, Any]]], None, None]:
+    """Yield the compressed significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only queried until the migration
+        # is done so the states are returned in a single chunk
+        if states := get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ):
+            yield cast(dict[str, list[dict[str, Any]]], states)
+        return
+    yield from _modern_iter_significant_states_chunks(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_rows,
+    )
+
+
+def get_state_changes_page(
+    hass: HomeAssistant,
+    session: Session,
+    entity_id: str,
+    start_time: datetime,
+    before: tuple[float, int] | None,
+    limit: int,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[list[dict[str, Any]], tuple[float, int] | None]:
+    """Return a page of compressed state changes of an entity before a keyset."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only queried until the migration
+        # is done so the states are returned in a single page
+        states = get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            dt_util.utc_from_timestamp(before[0]) if before else None,
+            [entity_id],
+            None,
+            False,
+            significant_changes_only,
+            False,
+            no_attributes,
+            True,
+        )
+        return cast(list[dict[str, Any]], states.get(entity_id, [])), None
+    return _modern_get_state_changes_page(
+        hass,
+        session,
+        entity_id,
+        start_time,
+        before,
+        limit,
+        significant_changes_only,
+        no_attributes,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
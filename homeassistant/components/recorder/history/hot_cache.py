@@ -0,0 +1,218 @@
+"""In-memory cache of recently recorded states for history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+import math
+import sys
+import threading
+from typing import NamedTuple
+
+# Each entity keeps at most this many recent rows, older rows
+# are dropped in batches to avoid shifting the arrays on every add
+MAX_ROWS_PER_ENTITY = 10000
+_TRIM_SLACK = MAX_ROWS_PER_ENTITY // 4
+
+
+class HotCacheRow(NamedTuple):
+    """A row with the same shape as a no_attributes history query row."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+
+
+class _EntityRows:
+    """Columnar storage of the recent states of a single entity."""
+
+    __slots__ = ("last_updated_ts", "last_changed_ts", "states")
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.last_updated_ts = array("d")
+        # NaN is stored when last_changed_ts is NULL in the database
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+
+    def add(
+        self, state: str | None, last_updated_ts: float, last_changed_ts: float | None
+    ) -> None:
+        """Add a row keeping the columns sorted by last_updated_ts."""
+        changed = math.nan if last_changed_ts is None else last_changed_ts
+        if state is not None:
+            state = sys.intern(state)
+        updated = self.last_updated_ts
+        if not updated or updated[-1] <= last_updated_ts:
+            updated.append(last_updated_ts)
+            self.last_changed_ts.append(changed)
+            self.states.append(state)
+            return
+        idx = bisect_right(updated, last_updated_ts)
+        updated.insert(idx, last_updated_ts)
+        self.last_changed_ts.insert(idx, changed)
+        self.states.insert(idx, state)
+
+    def trim(self, count: int) -> None:
+        """Drop the oldest count rows."""
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.states[:count]
+
+
+class HistoryHotCache:
+    """Keep the most recently committed states of each entity in memory.
+
+    The recorder thread adds states after they have been committed
+    and history queries read them from the database executor, so
+    all access is guarded by a lock.
+
+    An entity can only answer a query if its oldest cached row is
+    older than the start of the query since all rows newer than
+    the oldest cached row are known to be in the cache. When the
+    row budget is exceeded the least recently queried entities
+    are dropped.
+    """
+
+    def __init__(self, max_rows: int) -> None:
+        """Initialize the cache."""
+        self.max_rows = max_rows
+        self._rows = 0
+        self._entities: OrderedDict[int, _EntityRows] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached rows."""
+        return self._rows
+
+    def add_states(
+        self, rows: Iterable[tuple[int, str | None, float, float | None]]
+    ) -> None:
+        """Add committed states.
+
+        rows are (metadata_id, state, last_updated_ts, last_changed_ts).
+
+        Must be called from the recorder thread after the rows
+        have been committed.
+        """
+        entities = self._entities
+        with self._lock:
+            for metadata_id, state, last_updated_ts, last_changed_ts in rows:
+                if (entity_rows := entities.get(metadata_id)) is None:
+                    entity_rows = entities[metadata_id] = _EntityRows()
+                entity_rows.add(state, last_updated_ts, last_changed_ts)
+                self._rows += 1
+                if (
+                    excess := len(entity_rows.states) - MAX_ROWS_PER_ENTITY
+                ) > _TRIM_SLACK:
+                    entity_rows.trim(excess)
+                    self._rows -= excess
+            while self._rows > self.max_rows and entities:
+                _, evicted = entities.popitem(last=False)
+                self._rows -= len(evicted.states)
+
+    def evict_purged(
+        self, purge_before_ts: float, metadata_ids: Iterable[int] | None = None
+    ) -> None:
+        """Drop rows that were purged from the database.
+
+        Must be called from the recorder thread after the rows
+        have been deleted.
+        """
+        entities = self._entities
+        with self._lock:
+            if metadata_ids is None:
+                metadata_ids = list(entities)
+            for metadata_id in metadata_ids:
+                if (entity_rows := entities.get(metadata_id)) is None:
+                    continue
+                if count := bisect_left(entity_rows.last_updated_ts, purge_before_ts):
+                    entity_rows.trim(count)
+                    self._rows -= count
+                if not entity_rows.states:
+                    del entities[metadata_id]
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        with self._lock:
+            self._entities.clear()
+            self._rows = 0
+
+    def get_significant_rows(
+        self,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        metadata_ids: list[int],
+        metadata_ids_in_significant_domains: list[int],
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+    ) -> list[HotCacheRow] | None:
+        """Return the rows a no_attributes significant states query would.
+
+        Returns None if any of the entities is not fully covered
+        by the cache and the database must be queried instead.
+        """
+        entities = self._entities
+        significant_domain_ids = set(metadata_ids_in_significant_domains)
+        single_metadata_id = len(metadata_ids) == 1
+        result: list[HotCacheRow] = []
+        with self._lock:
+            covered: list[tuple[int, _EntityRows]] = []
+            for metadata_id in metadata_ids:
+                if (
+                    entity_rows := entities.get(metadata_id)
+                ) is None or entity_rows.last_updated_ts[0] >= start_time_ts:
+                    return None
+                covered.append((metadata_id, entity_rows))
+            for metadata_id, entity_rows in sorted(covered):
+                entities.move_to_end(metadata_id)
+                updated = entity_rows.last_updated_ts
+                changed = entity_rows.last_changed_ts
+                states = entity_rows.states
+                first = bisect_left(updated, start_time_ts)
+                if include_start_time_state and (
+                    single_metadata_id
+                    or (run_start_ts is not None and updated[first - 1] >= run_start_ts)
+                ):
+                    # The start state is reported with a last_updated_ts of 0
+                    # which is replaced with the start time, the same as the
+                    # literal the database query selects
+                    result.append(
+                        HotCacheRow(
+                            metadata_id,
+                            states[first - 1],
+                            0,
+                            None if significant_changes_only else 0,
+                        )
+                    )
+                # The database query excludes rows updated exactly at start_time
+                first = bisect_right(updated, start_time_ts, first)
+                last = (
+                    len(updated)
+                    if end_time_ts is None
+                    else bisect_left(updated, end_time_ts, first)
+                )
+                significant_domain = metadata_id in significant_domain_ids
+                for idx in range(first, last):
+                    last_updated_ts = updated[idx]
+                    last_changed_ts: float | None = changed[idx]
+                    if math.isnan(last_changed_ts):  # type: ignore[arg-type]
+                        last_changed_ts = None
+                    if significant_changes_only:
+                        if not (
+                            significant_domain
+                            or last_changed_ts is None
+                            or last_changed_ts == last_updated_ts
+                        ):
+                            continue
+                        last_changed_ts = None
+                    result.append(
+                        HotCacheRow(
+                            metadata_id, states[idx], last_updated_ts, last_changed_ts
+                        )
+                    )
+        return result
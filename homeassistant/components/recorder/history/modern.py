@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -19,8 +19,10 @@ from sqlalchemy import (
     select,
     union_all,
 )
+from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -253,8 +255,68 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    # The hot cache does not keep attributes so it can only
+    # answer compressed requests that do not ask for them
+    if (
+        no_attributes
+        and compressed_state_format
+        and (hot_cache := instance.history_hot_cache) is not None
+        and (
+            hot_rows := hot_cache.get_significant_rows(
+                start_time_ts,
+                end_time_ts,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                include_start_time_state,
+                run_start_ts,
+            )
+        )
+        is not None
+    ):
+        return _sorted_states_to_dict(
+            cast(list[Row], hot_rows),
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+        )
+    stmt = _significant_states_lambda_stmt(
+        start_time_ts,
+        end_time_ts,
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+    )
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_lambda_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> StatementLambdaElement:
+    """Return the cached statement for significant state changes."""
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
+    return lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
             end_time_ts,
@@ -275,15 +337,138 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+
+
+def iter_significant_states_chunks(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_rows: int,
+) -> Generator[dict[str, list[dict[str, Any]]], None, None]:
+    """Yield the compressed significant states in chunks of about chunk_rows rows.
+
+    The rows are read with yield_per from a server side cursor so only
+    a chunk of the result is held in memory at a time. A chunk may end
+    in the middle of the states of an entity, in which case the next
+    chunk continues with the remaining states of that entity.
+    """
+    instance = recorder.get_instance(hass)
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    metadata_ids_in_significant_domains: list[int] = []
+    if significant_changes_only:
+        metadata_ids_in_significant_domains = [
+            metadata_id
+            for metadata_id, entity_id in metadata_id_to_entity_id.items()
+            if split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+        ]
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    stmt = _significant_states_lambda_stmt(
+        start_time_ts,
+        datetime_to_timestamp_or_none(end_time),
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+    )
+    rows = cast(
+        Result,
+        execute_stmt_lambda_element(
+            session, stmt, yield_per=chunk_rows, orm_rows=False, stream_results=True
+        ),
     )
+    # The cursor is closed as soon as the caller stops reading chunks
+    try:
+        yield from _iter_compressed_chunks(
+            rows,
+            metadata_id_to_entity_id,
+            start_time_ts if include_start_time_state else None,
+            minimal_response,
+            no_attributes,
+            chunk_rows,
+        )
+    finally:
+        rows.close()
+
+
+def _iter_compressed_chunks(
+    rows: Result,
+    metadata_id_to_entity_id: dict[int, str],
+    row_start_time_ts: float | None,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_rows: int,
+) -> Generator[dict[str, list[dict[str, Any]]], None, None]:
+    """Yield chunks of about chunk_rows compressed states from rows."""
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    chunk_size = 0
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        full_states = (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        first = True
+        ent_results = chunk.setdefault(entity_id, [])
+        for row in group:
+            state = row[state_idx]
+            if full_states or first:
+                ent_results.append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        row_start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        False if full_states else no_attributes,
+                    )
+                )
+                first = False
+            elif state != prev_state:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                )
+            else:
+                continue
+            prev_state = state
+            chunk_size += 1
+            if chunk_size >= chunk_rows:
+                yield {key: val for key, val in chunk.items() if val}
+                chunk = {}
+                chunk_size = 0
+                ent_results = chunk.setdefault(entity_id, [])
+    if chunk := {key: val for key, val in chunk.items() if val}:
+        yield chunk
 
 
 def get_full_significant_states_with_session(
@@ -452,6 +637,109 @@ def state_changes_during_period(
         )
 
 
+def _state_changes_page_stmt(
+    metadata_id: int,
+    start_time_ts: float,
+    before_ts: float | None,
+    before_state_id: int,
+    limit: int,
+    significant_changes_filter: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+) -> Select:
+    stmt = (
+        _stmt_and_join_attributes(no_attributes, include_last_changed, False)
+        .add_columns(States.state_id)
+        .filter(States.metadata_id == metadata_id)
+        .filter(States.last_updated_ts > start_time_ts)
+    )
+    if significant_changes_filter:
+        stmt = stmt.filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+    if before_ts is not None:
+        stmt = stmt.filter(
+            (States.last_updated_ts < before_ts)
+            | (
+                (States.last_updated_ts == before_ts)
+                & (States.state_id < before_state_id)
+            )
+        )
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    # The rows are found with the metadata_id, last_updated_ts index.
+    # The keyset is only read in index order where that index also holds
+    # the state_id, as InnoDB does with its clustered primary key. Other
+    # databases may sort the rows that share a last_updated_ts by
+    # state_id after reading them, such ties are rare.
+    return stmt.order_by(States.last_updated_ts.desc(), States.state_id.desc()).limit(
+        limit
+    )
+
+
+def get_state_changes_page(
+    hass: HomeAssistant,
+    session: Session,
+    entity_id: str,
+    start_time: datetime,
+    before: tuple[float, int] | None,
+    limit: int,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[list[dict[str, Any]], tuple[float, int] | None]:
+    """Return a page of compressed state changes of an entity.
+
+    The page holds the newest limit states after start_time that come
+    before the (last_updated_ts, state_id) keyset in before, oldest first.
+    The keyset of the oldest state is returned to fetch the next page
+    unless the page is the last one.
+    """
+    instance = recorder.get_instance(hass)
+    if not (metadata_id := instance.states_meta_manager.get(entity_id, session, False)):
+        return [], None
+    significant_changes_filter = (
+        significant_changes_only
+        and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS
+    )
+    include_last_changed = not significant_changes_only
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    before_ts, before_state_id = before if before else (None, 0)
+    # The keyset filter is only added when there is a cursor, so the
+    # statement is built directly instead of being cached as a lambda
+    rows = session.execute(
+        _state_changes_page_stmt(
+            metadata_id,
+            start_time_ts,
+            before_ts,
+            before_state_id,
+            limit,
+            significant_changes_filter,
+            include_last_changed,
+            no_attributes,
+        )
+    ).all()
+    attr_cache: dict[str, dict[str, Any]] = {}
+    states = [
+        row_to_compressed_state(
+            row,
+            attr_cache,
+            None,
+            entity_id,
+            row.state,
+            row.last_updated_ts,
+            no_attributes,
+        )
+        for row in reversed(rows)
+    ]
+    if len(rows) < limit:
+        return states, None
+    oldest = rows[-1]
+    return states, (oldest.last_updated_ts, oldest.state_id)
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
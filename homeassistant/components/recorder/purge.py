@@ -7,7 +7,7 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -52,6 +52,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Stop selecting more batches once a purge cycle has run this long so
+# the recorder can commit the states that queued up in the meantime
+DEFAULT_PURGE_CYCLE_TIME_BUDGET = 2.0
 
 
 @retryable_database_job("purge")
@@ -62,11 +65,16 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = DEFAULT_PURGE_CYCLE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    At least one batch of states and events is purged per call, further
+    batches are only purged while the time budget has not been used up.
     """
+    deadline = time.monotonic() + time_budget
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -87,10 +95,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -178,6 +186,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,8 +210,14 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    if instance.history_hot_cache is not None:
+        instance.history_hot_cache.evict_purged(purge_before.timestamp())
+    _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch, purge_before.timestamp()
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,6 +230,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,8 +252,10 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    _purge_unused_data_ids(instance, session, data_ids_batch, purge_before.timestamp())
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -288,8 +306,25 @@ def _select_unused_attributes_ids(
     session: Session,
     attributes_ids: set[int],
     database_engine: DatabaseEngine,
+    purge_before_ts: float | None = None,
 ) -> set[int]:
-    """Return a set of attributes ids that are not used by any states in the db."""
+    """Return a set of attributes ids that are not used by any states in the db.
+
+    When only states last updated before purge_before_ts were purged, the
+    attributes ids referenced by newer states are known to still be in use
+    and are not looked up in the database.
+    """
+    references = instance.state_attributes_manager.references
+    if purge_before_ts is None:
+        # The purged states may have been newer than any state that
+        # referenced the attributes so the references are stale
+        references.evict(attributes_ids)
+    elif referenced_ids := references.referenced_since(attributes_ids, purge_before_ts):
+        _LOGGER.debug(
+            "Skipped %s attributes ids referenced by newer states",
+            len(referenced_ids),
+        )
+        attributes_ids = attributes_ids - referenced_ids
     if not attributes_ids:
         return set()
 
@@ -365,12 +400,13 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
+    purge_before_ts: float | None = None,
 ) -> None:
     """Purge unused attributes ids."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
-        instance, session, attributes_ids_batch, database_engine
+        instance, session, attributes_ids_batch, database_engine, purge_before_ts
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
 
@@ -380,8 +416,20 @@ def _select_unused_event_data_ids(
     session: Session,
     data_ids: set[int],
     database_engine: DatabaseEngine,
+    purge_before_ts: float | None = None,
 ) -> set[int]:
-    """Return a set of event data ids that are not used by any events in the db."""
+    """Return a set of event data ids that are not used by any events in the db.
+
+    See _select_unused_attributes_ids for how purge_before_ts is used.
+    """
+    references = instance.event_data_manager.references
+    if purge_before_ts is None:
+        references.evict(data_ids)
+    elif referenced_ids := references.referenced_since(data_ids, purge_before_ts):
+        _LOGGER.debug(
+            "Skipped %s data ids referenced by newer events", len(referenced_ids)
+        )
+        data_ids = data_ids - referenced_ids
     if not data_ids:
         return set()
 
@@ -412,12 +460,15 @@ def _select_unused_event_data_ids(
 
 
 def _purge_unused_data_ids(
-    instance: Recorder, session: Session, data_ids_batch: set[int]
+    instance: Recorder,
+    session: Session,
+    data_ids_batch: set[int],
+    purge_before_ts: float | None = None,
 ) -> None:
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, data_ids_batch, database_engine
+        instance, session, data_ids_batch, database_engine, purge_before_ts
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
 
@@ -702,6 +753,10 @@ def _purge_filtered_states(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
+    if instance.history_hot_cache is not None:
+        instance.history_hot_cache.evict_purged(
+            purge_before_timestamp, cast(list[int], metadata_ids_to_purge)
+        )
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
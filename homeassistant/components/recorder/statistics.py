@@ -9,9 +9,10 @@ from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
-from operator import itemgetter
+import math
+from operator import attrgetter, itemgetter
 import re
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
@@ -147,6 +148,7 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
 
 
 def mean(values: list[float]) -> float | None:
@@ -190,6 +192,121 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+class _AccumulatedStatistic(NamedTuple):
+    """The columns of a short term statistic used for the hourly summary."""
+
+    start_ts: float
+    mean: float | None
+    min: float | None
+    max: float | None
+    last_reset_ts: float | None
+    state: float | None
+    sum: float | None
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Accumulator of the short term statistics compiled during an hour.
+
+    The short term statistics of each 5-minute period are kept in memory
+    after they have been committed so the hourly statistics can be
+    summarized without reading them back from the database. If any of
+    the periods of the hour was not compiled by the accumulator, for
+    example because the recorder was restarted during the hour or the
+    statistics were modified, the hourly statistics are compiled from
+    the database instead.
+    """
+
+    # This is a mapping of period start_ts:metadata_id:short term statistics
+    # for the periods which have been committed to the database
+    _periods: dict[float, dict[int, _AccumulatedStatistic]] = dataclasses.field(
+        default_factory=dict
+    )
+    _pending_start_ts: float | None = None
+    _pending: dict[int, _AccumulatedStatistic] = dataclasses.field(default_factory=dict)
+
+    def add_pending(self, start_ts: float, stats: Iterable[StatisticsBase]) -> None:
+        """Add the short term statistics of a period which is not yet committed."""
+        self._pending_start_ts = start_ts
+        self._pending = {
+            stat.metadata_id: _AccumulatedStatistic(
+                start_ts,
+                stat.mean,
+                stat.min,
+                stat.max,
+                stat.last_reset_ts,
+                stat.state,
+                stat.sum,
+            )
+            for stat in stats
+            if stat.metadata_id is not None
+        }
+
+    def commit_pending(self, start_ts: float) -> None:
+        """Mark the pending period as committed."""
+        if self._pending_start_ts != start_ts:
+            return
+        hour_start_ts = start_ts - start_ts % 3600
+        self._periods = {
+            period_start_ts: period
+            for period_start_ts, period in self._periods.items()
+            if period_start_ts >= hour_start_ts
+        }
+        self._periods[start_ts] = self._pending
+        self._pending_start_ts = None
+        self._pending = {}
+
+    def reset(self) -> None:
+        """Forget all periods."""
+        self._periods.clear()
+        self._pending_start_ts = None
+        self._pending = {}
+
+    def summarize(
+        self, start_time_ts: float, end_time_ts: float
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Summarize an hour the same way the database queries would.
+
+        Returns None if not all periods of the hour are known.
+        """
+        periods = dict(self._periods)
+        if self._pending_start_ts is not None:
+            periods[self._pending_start_ts] = self._pending
+        period_starts = {start_time_ts + offset for offset in range(0, 3600, 300)}
+        if not period_starts.issubset(periods):
+            return None
+        by_metadata_id: defaultdict[int, list[_AccumulatedStatistic]] = defaultdict(
+            list
+        )
+        for period_start_ts in sorted(period_starts):
+            for metadata_id, stat in periods[period_start_ts].items():
+                if start_time_ts <= stat.start_ts < end_time_ts:
+                    by_metadata_id[metadata_id].append(stat)
+        summary: dict[int, StatisticDataTimestamp] = {}
+        for metadata_id, stats in by_metadata_id.items():
+            means = [stat.mean for stat in stats if stat.mean is not None]
+            mins = [stat.min for stat in stats if stat.min is not None]
+            maxes = [stat.max for stat in stats if stat.max is not None]
+            last = max(stats, key=attrgetter("start_ts"))
+            item: StatisticDataTimestamp = {
+                "start_ts": start_time_ts,
+                "last_reset_ts": last.last_reset_ts,
+            }
+            # Columns without a value are left out, the same as NULL
+            if means:
+                item["mean"] = sum(means) / len(means)
+            if mins:
+                item["min"] = min(mins)
+            if maxes:
+                item["max"] = max(maxes)
+            if last.state is not None:
+                item["state"] = last.state
+            if last.sum is not None:
+                item["sum"] = last.sum
+            summary[metadata_id] = item
+        return summary
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -383,18 +500,90 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    accumulator: HourlyStatisticsAccumulator | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the accumulator has seen all 5-minute statistics of the hour
+    they are summarized in memory instead.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + timedelta(hours=1)
     end_time_ts = end_time.timestamp()
 
+    if (
+        accumulator is None
+        or (summary := accumulator.summarize(start_time_ts, end_time_ts)) is None
+    ):
+        summary = _compile_hourly_statistics_summary(
+            session, start_time_ts, end_time_ts
+        )
+    elif _LOGGER.isEnabledFor(logging.DEBUG):
+        _check_hourly_statistics_summary(
+            session, start_time, start_time_ts, end_time_ts, summary
+        )
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _check_hourly_statistics_summary(
+    session: Session,
+    start_time: datetime,
+    start_time_ts: float,
+    end_time_ts: float,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Log if the accumulated hourly statistics differ from the database."""
+    db_summary = _compile_hourly_statistics_summary(session, start_time_ts, end_time_ts)
+    mismatched = [
+        metadata_id
+        for metadata_id in summary.keys() | db_summary.keys()
+        if not _hourly_summary_items_equal(
+            summary.get(metadata_id), db_summary.get(metadata_id)
+        )
+    ]
+    if mismatched:
+        _LOGGER.debug(
+            "Accumulated hourly statistics for %s differ from the database for"
+            " metadata_ids %s",
+            start_time,
+            mismatched,
+        )
+
+
+def _hourly_summary_items_equal(
+    item: StatisticDataTimestamp | None, other: StatisticDataTimestamp | None
+) -> bool:
+    """Return if two hourly summary items are equal within float tolerance."""
+    if item is None or other is None:
+        return item is other
+    for key in ("mean", "min", "max", "last_reset_ts", "state", "sum"):
+        value: float | None = item.get(key)  # type: ignore[assignment]
+        other_value: float | None = other.get(key)  # type: ignore[assignment]
+        if value is None or other_value is None:
+            if value is not other_value:
+                return False
+        elif not math.isclose(value, other_value, rel_tol=1e-9):
+            return False
+    return True
+
+
+def _compile_hourly_statistics_summary(
+    session: Session, start_time_ts: float, end_time_ts: float
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics of an hour with database queries."""
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
@@ -433,11 +622,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -449,6 +634,8 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     last_period = now.replace(minute=last_period_minutes, second=0, microsecond=0)
     start = now - timedelta(days=instance.keep_days)
     start = start.replace(minute=0, second=0, microsecond=0)
+    # The periods compiled here are not accumulated
+    get_hourly_statistics_accumulator(instance.hass).reset()
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
 
@@ -468,7 +655,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             end = start + timedelta(minutes=period_size)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             modified_statistic_ids = _compile_statistics(
-                instance, session, start, end >= last_period
+                instance, session, start, end >= last_period, None
             )
             if periods_without_commit == commit_interval or modified_statistic_ids:
                 session.commit()
@@ -490,6 +677,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # filter_unique_constraint_integrity_error which would make
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
 
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
@@ -499,8 +687,10 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         ),
     ) as session:
         modified_statistic_ids = _compile_statistics(
-            instance, session, start, fire_events
+            instance, session, start, fire_events, accumulator
         )
+        session.commit()
+        accumulator.commit_pending(start.timestamp())
 
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
@@ -519,7 +709,11 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    accumulator: HourlyStatisticsAccumulator | None,
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
@@ -580,9 +774,12 @@ def _compile_statistics(
         ):
             new_short_term_stats.append(new_stat)
 
+    if accumulator is not None:
+        accumulator.add_pending(start.timestamp(), new_short_term_stats)
+
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -729,6 +926,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_hourly_statistics_accumulator(instance.hass).reset()
 
 
 def update_statistics_metadata(
@@ -2287,6 +2485,9 @@ def _import_statistics_with_session(
     if table != StatisticsShortTerm:
         return True
 
+    # The imported short term statistics may be part of the current hour
+    get_hourly_statistics_accumulator(instance.hass).reset()
+
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2305,6 +2506,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the hourly statistics accumulator."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2405,6 +2614,7 @@ def adjust_statistics(
             start_time,
             sum_adjustment,
         )
+        get_hourly_statistics_accumulator(instance.hass).reset()
 
         _adjust_sum_statistics(
             session,
@@ -2477,6 +2687,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        get_hourly_statistics_accumulator(instance.hass).reset()
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
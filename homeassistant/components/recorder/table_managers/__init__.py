@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -75,3 +76,53 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class NewestReferences:
+    """Track the newest committed row that referenced each shared id.
+
+    A time based purge only deletes rows older than the purge cutoff,
+    so a shared id that a newer row referenced is still in use and
+    does not need to be looked up in the database to find out.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the references."""
+        self._newest: LRU[int, float] = LRU(size)
+
+    def add(self, shared_id: int, timestamp: float) -> None:
+        """Record that a committed row referenced shared_id at timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        newest = self._newest
+        if newest.get(shared_id, 0.0) < timestamp:
+            newest[shared_id] = timestamp
+
+    def referenced_since(self, shared_ids: set[int], timestamp: float) -> set[int]:
+        """Return the shared_ids referenced by a row at or after timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        newest = self._newest
+        return {
+            shared_id
+            for shared_id in shared_ids
+            if newest.get(shared_id, 0.0) >= timestamp
+        }
+
+    def evict(self, shared_ids: Iterable[int]) -> None:
+        """Forget the references to shared_ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        newest = self._newest
+        for shared_id in shared_ids:
+            newest.pop(shared_id, None)
+
+    def clear(self) -> None:
+        """Forget all references."""
+        self._newest.clear()
@@ -12,10 +12,10 @@ from homeassistant.core import Event
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from ..db_schema import EventData
+from ..db_schema import EventData, Events
 from ..queries import get_shared_event_datas
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLRUTableManager, NewestReferences
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 CACHE_SIZE = 2048
 
+# The number of data ids to remember the newest referencing event for
+REFERENCES_CACHE_SIZE = 16384
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -33,6 +36,8 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        self.references = NewestReferences(REFERENCES_CACHE_SIZE)
+        self._pending_references: list[Events] = []
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -116,6 +121,14 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         shared_data: str = db_event_data.shared_data
         self._pending[shared_data] = db_event_data
 
+    def add_pending_reference(self, db_event: Events) -> None:
+        """Add a pending Events whose data_id is referenced once committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_references.append(db_event)
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the data_ids of the new EventData into the LRU.
 
@@ -125,6 +138,25 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
         self._pending.clear()
+        references = self.references
+        for db_event in self._pending_references:
+            if (data_id := db_event.data_id) is None and (
+                event_data := db_event.event_data_rel
+            ):
+                data_id = event_data.data_id
+            if data_id is not None and db_event.time_fired_ts is not None:
+                references.add(data_id, db_event.time_fired_ts)
+        self._pending_references.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self.references.clear()
+        self._pending_references.clear()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
@@ -132,6 +164,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self.references.evict(data_ids)
         id_map = self._id_map
         event_data_ids_reversed = {
             data_id: shared_data for shared_data, data_id in id_map.items()
@@ -12,10 +12,10 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from ..db_schema import StateAttributes
+from ..db_schema import StateAttributes, States
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLRUTableManager, NewestReferences
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -28,6 +28,9 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of attribute ids to remember the newest referencing state for
+REFERENCES_CACHE_SIZE = 16384
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -38,6 +41,8 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        self.references = NewestReferences(REFERENCES_CACHE_SIZE)
+        self._pending_references: list[States] = []
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -127,6 +132,14 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
+    def add_pending_reference(self, db_state: States) -> None:
+        """Add a pending States whose attributes_id is referenced once committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_references.append(db_state)
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
 
@@ -136,6 +149,25 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
+        references = self.references
+        for db_state in self._pending_references:
+            if (attributes_id := db_state.attributes_id) is None and (
+                state_attributes := db_state.state_attributes
+            ):
+                attributes_id = state_attributes.attributes_id
+            if attributes_id is not None and db_state.last_updated_ts is not None:
+                references.add(attributes_id, db_state.last_updated_ts)
+        self._pending_references.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self.references.clear()
+        self._pending_references.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -143,6 +175,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self.references.evict(attributes_ids)
         id_map = self._id_map
         state_attributes_ids_reversed = {
             attributes_id: shared_attrs
@@ -11,6 +11,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -45,6 +46,25 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state that will be written with a bulk insert.
+
+        States added here are not added to the session and will
+        be inserted in commit order when the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def get_pending_inserts(self) -> list[States]:
+        """Return the states waiting to be written with a bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_inserts
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -64,6 +84,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +95,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
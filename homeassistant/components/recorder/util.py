@@ -207,6 +207,7 @@ def execute_stmt_lambda_element(
     end_time: datetime | None = None,
     yield_per: int = DEFAULT_YIELD_STATES_ROWS,
     orm_rows: bool = True,
+    stream_results: bool = False,
 ) -> Sequence[Row] | Result:
     """Execute a StatementLambdaElement.
 
@@ -218,8 +219,16 @@ def execute_stmt_lambda_element(
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
+
+    If stream_results is set the rows are always read with
+    yield_per from a server side cursor on databases that
+    support them, regardless of the time window.
     """
-    use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    use_all = not stream_results and (
+        not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    )
+    if stream_results:
+        stmt = stmt.execution_options(stream_results=True, yield_per=yield_per)
     for tryno in range(RETRIES):
         try:
             if orm_rows:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Iterable
 import datetime
 import itertools
 import logging
@@ -102,32 +102,38 @@ def _time_weighted_average(
     Note: there's no interpolation of values between state changes.
     """
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time_ts: float | None = None
     accumulated = 0.0
+    # Work with timestamps to avoid creating a datetime and
+    # a timedelta for every state in the period
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
     for fstate, state in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
+        start_time_ts = (
+            start_ts
+            if (last_updated_ts := state.last_updated_timestamp) < start_ts
+            else last_updated_ts
+        )
+        if old_start_time_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time_ts
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * (start_time_ts - old_start_time_ts)
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_time_ts = start_time_ts
 
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_time_ts is not None
+        accumulated += old_fstate * (end_ts - old_start_time_ts)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -224,8 +230,7 @@ def _normalize_states(
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
     valid_fstates: list[tuple[float, State]] = []
-    convert: Callable[[float], float] | None = None
-    last_unit: str | None | object = object()
+    units: list[str | None] = []
     valid_units = converter.VALID_UNITS
 
     for fstate, state in fstates:
@@ -251,21 +256,30 @@ def _normalize_states(
                 )
             continue
 
-        if state_unit != last_unit:
-            # The unit of measurement has changed since the last state change
-            # recreate the converter factory
-            if state_unit == statistics_unit:
-                convert = None
-            else:
-                convert = converter.converter_factory(state_unit, statistics_unit)
-            last_unit = state_unit
-
-        if convert is not None:
-            fstate = convert(fstate)
-
         valid_fstates.append((fstate, state))
+        units.append(state_unit)
+
+    if all(unit == statistics_unit for unit in units):
+        return statistics_unit, valid_fstates
+
+    # Convert consecutive states with the same unit in one batch
+    converted_fstates: list[tuple[float, State]] = []
+    idx = 0
+    for state_unit, group in itertools.groupby(units):
+        count = len(list(group))
+        run = valid_fstates[idx : idx + count]
+        idx += count
+        converted_fstates.extend(
+            zip(
+                converter.convert_many(
+                    (fstate for fstate, _ in run), state_unit, statistics_unit
+                ),
+                (state for _, state in run),
+                strict=True,
+            )
+        )
 
-    return statistics_unit, valid_fstates
+    return statistics_unit, converted_fstates
 
 
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
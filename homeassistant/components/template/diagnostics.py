@@ -0,0 +1,22 @@
+"""Diagnostics support for Template."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import async_get_cache_stats, async_get_render_times
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "config_entry": entry.as_dict(),
+        "template_cache": async_get_cache_stats(hass),
+        "render_times": async_get_render_times(
+            hass, (value for value in entry.options.values() if isinstance(value, str))
+        ),
+    }
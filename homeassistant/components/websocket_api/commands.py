@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -55,14 +57,26 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_import_timings,
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+)
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
-from .messages import construct_result_message
+from .messages import (
+    construct_result_list_message,
+    construct_result_message,
+    join_json_members,
+)
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[_EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -356,35 +370,108 @@ def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
     """Send handle get states response."""
-    connection.send_message(
-        construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
-        )
-    )
+    connection.send_message(construct_result_list_message(msg_id, serialized_states))
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+type _EntitySubscription = tuple[
+    Callable[[str | bytes | dict[str, Any]], None], User, bytes
+]
+
+_ALL_ENTITIES: frozenset[str] = frozenset()
+
+
+class _EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every subscription. Subscriptions
+    are grouped by their entity filter and the groups are indexed by entity_id
+    so an event only visits the subscriptions it is sent to. The diff message
+    is serialized once per event and shared by all of them.
+    """
+
+    __slots__ = ("_hass", "_groups", "_groups_by_entity_id", "_next_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._groups: dict[frozenset[str], dict[int, _EntitySubscription]] = {}
+        self._groups_by_entity_id: defaultdict[
+            str, dict[frozenset[str], dict[int, _EntitySubscription]]
+        ] = defaultdict(dict)
+        self._next_id = 0
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: set[str], subscription: _EntitySubscription
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entity_ids or all entities if empty."""
+        key = frozenset(entity_ids)
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = {}
+            for entity_id in key:
+                self._groups_by_entity_id[entity_id][key] = group
+        subscription_id = self._next_id
+        self._next_id += 1
+        group[subscription_id] = subscription
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            del group[subscription_id]
+            if group:
+                return
+            del self._groups[key]
+            for entity_id in key:
+                groups = self._groups_by_entity_id[entity_id]
+                del groups[key]
+                if not groups:
+                    del self._groups_by_entity_id[entity_id]
+            if not self._groups and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        # Users are checked once per event since the same user
+        # usually has several dashboards open
+        allowed: dict[str, bool] = {}
+        if (group := self._groups.get(_ALL_ENTITIES)) is not None:
+            self._async_send(event, entity_id, group, allowed)
+        if (groups := self._groups_by_entity_id.get(entity_id)) is not None:
+            for group in list(groups.values()):
+                self._async_send(event, entity_id, group, allowed)
+
+    @callback
+    def _async_send(
+        self,
+        event: Event[EventStateChangedData],
+        entity_id: str,
+        group: dict[int, _EntitySubscription],
+        allowed: dict[str, bool],
+    ) -> None:
+        """Send the state diff to the subscriptions of a group."""
+        for send_message, user, message_id_as_bytes in list(group.values()):
+            if not user.is_admin:
+                if (user_allowed := allowed.get(user.id)) is None:
+                    # We have to lookup the permissions again because the user
+                    # might have changed since the subscription was created.
+                    permissions = user.permissions
+                    user_allowed = allowed[user.id] = permissions.access_all_entities(
+                        POLICY_READ
+                    ) or permissions.check_entity(entity_id, POLICY_READ)
+                if not user_allowed:
+                    continue
+            send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
 @callback
@@ -404,15 +491,12 @@ def handle_subscribe_entities(
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    if (subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(
+            hass
+        )
+    connection.subscriptions[msg["id"]] = subscriptions.async_subscribe(
+        entity_ids, (connection.send_message, connection.user, message_id_as_bytes)
     )
     connection.send_result(msg["id"])
 
@@ -451,14 +535,12 @@ def _send_handle_entities_init_response(
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
-        b"".join(
-            (
-                b'{"id":',
-                str(msg_id).encode(),
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
-            )
+        join_json_members(
+            b"".join(
+                (b'{"id":', str(msg_id).encode(), b',"type":"event","event":{"a":{')
+            ),
+            serialized_states,
+            b"}}}",
         )
     )
 
@@ -538,10 +620,15 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_timings = async_get_import_timings(hass)
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": seconds}
+            {
+                "domain": integration,
+                "seconds": seconds,
+                "import_seconds": import_timings.get(integration),
+            }
             for integration, seconds in async_get_setup_timings(hass).items()
         ],
     )
@@ -78,6 +78,35 @@ def construct_result_message(iden: int, payload: bytes) -> bytes:
     )
 
 
+def construct_result_list_message(iden: int, payloads: list[bytes]) -> bytes:
+    """Construct a success result message JSON with a list of JSON payloads."""
+    return join_json_members(
+        b"".join(
+            (
+                b'{"id":',
+                str(iden).encode(),
+                b',"type":"result","success":true,"result":[',
+            )
+        ),
+        payloads,
+        b"]}",
+    )
+
+
+def join_json_members(prefix: bytes, members: list[bytes], suffix: bytes) -> bytes:
+    """Join JSON members with commas between prefix and suffix.
+
+    The members of large messages such as get_states add up to
+    several megabytes so they are copied only once instead of
+    joining them first and wrapping the result afterwards.
+    """
+    if not members:
+        return prefix + suffix
+    if len(members) == 1:
+        return b"".join((prefix, members[0], suffix))
+    return b",".join((prefix + members[0], *members[1:-1], members[-1] + suffix))
+
+
 def error_message(
     iden: int | None,
     code: str,
@@ -154,7 +183,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            _partial_cached_state_diff_message(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -166,15 +195,15 @@ def cached_state_diff_message(
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed without the id and the closing
+    brace which will be appended in cached_state_diff_message
     """
     return (
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
         )
         or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    )[:-1]
 
 
 def _state_diff_event(
@@ -221,9 +250,9 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -44,6 +44,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -1887,10 +1888,21 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @cached_property
+    def _attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes.
+
+        The state machine hands the fragment on to the next state of
+        the entity if the attributes did not change.
+        """
+        return json_fragment(json_bytes(self.attributes))
+
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": self._attributes_json_fragment}
+        )
 
     @cached_property
     def json_fragment(self) -> json_fragment:
@@ -1933,7 +1945,11 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state = {
+            **self.as_compressed_state,
+            COMPRESSED_STATE_ATTRIBUTES: self._attributes_json_fragment,
+        }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2041,10 +2057,23 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Types of attribute values that can be shared between states, the type is
+# part of the key since 1, 1.0 and True are equal and hash the same
+_INTERNABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+type _InternedAttributesKey = tuple[tuple[str, type, Any], ...]
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2055,6 +2084,10 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Attributes of current and recent states keyed by their typed items
+        self._interned_attributes: weakref.WeakValueDictionary[
+            _InternedAttributesKey, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2307,6 +2340,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2322,6 +2357,16 @@ class StateMachine:
             state_info,
         )
         if old_state is not None:
+            if (
+                same_attr
+                and (
+                    attributes_json := old_state.__dict__.get(
+                        "_attributes_json_fragment"
+                    )
+                )
+                is not None
+            ):
+                state.__dict__["_attributes_json_fragment"] = attributes_json
             old_state.expire()
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
@@ -2336,6 +2381,32 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a ReadOnlyDict of the attributes shared with equal attributes.
+
+        Only attributes where all values are scalars are shared.
+        """
+        key: _InternedAttributesKey | None = None
+        if all(
+            type(value) in _INTERNABLE_ATTRIBUTE_TYPES for value in attributes.values()
+        ):
+            key = tuple(
+                (name, type(value), value) for name, value in attributes.items()
+            )
+            if (interned := self._interned_attributes.get(key)) is not None:
+                return interned
+        # State only creates and expects a ReadOnlyDict so
+        # there is no need to check for subclassing with
+        # isinstance here so we can use the faster type check.
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        if key is not None:
+            self._interned_attributes[key] = attributes
+        return attributes
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
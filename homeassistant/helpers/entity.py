@@ -31,6 +31,7 @@ from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     ATTR_UNIT_OF_MEASUREMENT,
     DEVICE_DEFAULT_NAME,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
@@ -83,6 +84,14 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# Entity registry options used by the entity base class
+ENTITY_OPTIONS_CORE = "core"
+# Writes that change the state within this many seconds of the last
+# write are merged into one write at the end of the window
+STATE_WRITE_COALESCE_WINDOW = "state_write_coalesce_window"
+MAX_STATE_WRITE_COALESCE_WINDOW = 300
+DATA_COALESCED_STATE_WRITES = "coalesced_state_writes"
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -98,6 +107,30 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+@singleton.singleton(DATA_COALESCED_STATE_WRITES)
+def _coalesced_state_writes(hass: HomeAssistant) -> dict[str, int]:
+    """Get the number of coalesced state writes by entity_id."""
+    return {}
+
+
+@callback
+def async_get_coalesced_state_writes(hass: HomeAssistant) -> dict[str, Any]:
+    """Return statistics about state writes suppressed by coalescing.
+
+    The saved fan-out is estimated from the number of state_changed
+    listeners currently registered.
+    """
+    suppressed_writes = _coalesced_state_writes(hass)
+    total = sum(suppressed_writes.values())
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    return {
+        "suppressed_writes": dict(suppressed_writes),
+        "total_suppressed_writes": total,
+        "estimated_listener_calls_saved": total * listeners,
+    }
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -492,6 +525,10 @@ class Entity(
     _context: Context | None = None
     _context_set: float | None = None
 
+    # State write coalescing
+    _coalesced_write_handle: asyncio.TimerHandle | None = None
+    _last_state_write: float | None = None
+
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
@@ -1194,6 +1231,17 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (
+            entry
+            and (core_options := entry.options.get(ENTITY_OPTIONS_CORE))
+            and (window := core_options.get(STATE_WRITE_COALESCE_WINDOW))
+            # Invalid windows disable coalescing rather than delaying writes
+            and type(window) in (int, float)
+            and 0 < window <= MAX_STATE_WRITE_COALESCE_WINDOW
+            and self._async_coalesce_state_write(window, state, attr, time_now)
+        ):
+            return
+
         try:
             hass.states.async_set(
                 entity_id,
@@ -1212,6 +1260,49 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def _async_coalesce_state_write(
+        self, window: float, state: str, attr: dict[str, Any], time_now: float
+    ) -> bool:
+        """Return True if the state write is deferred to the end of the window.
+
+        Writes that do not change the state or attributes are never deferred
+        so last_reported stays accurate.
+        """
+        if self._coalesced_write_handle is None and (
+            (last_state_write := self._last_state_write) is None
+            or time_now - last_state_write >= window
+        ):
+            self._last_state_write = time_now
+            return False
+
+        if (
+            not self.force_update
+            and (current := self.hass.states.get(self.entity_id)) is not None
+            and current.state == state
+            and current.attributes == attr
+        ):
+            return False
+
+        if self._coalesced_write_handle is None:
+            if TYPE_CHECKING:
+                assert last_state_write is not None
+            self._coalesced_write_handle = self.hass.loop.call_later(
+                last_state_write + window - time_now, self._async_write_coalesced_state
+            )
+        coalesced_state_writes = _coalesced_state_writes(self.hass)
+        coalesced_state_writes[self.entity_id] = (
+            coalesced_state_writes.get(self.entity_id, 0) + 1
+        )
+        return True
+
+    @callback
+    def _async_write_coalesced_state(self) -> None:
+        """Write the state at the end of the coalescing window."""
+        self._coalesced_write_handle = None
+        self._last_state_write = None
+        self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1472,6 +1563,11 @@ class Entity(
 
         Not to be extended by integrations.
         """
+        if self._coalesced_write_handle is not None:
+            self._coalesced_write_handle.cancel()
+            self._coalesced_write_handle = None
+        _coalesced_state_writes(self.hass).pop(self.entity_id, None)
+
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
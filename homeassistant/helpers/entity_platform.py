@@ -669,6 +669,24 @@ class EntityPlatform:
             self._async_handle_interval_callback,
         )
 
+    @callback
+    def _async_registry_entry_disabled(
+        self, entity: Entity, entity_registry: EntityRegistry
+    ) -> bool:
+        """Return if the registry entry of an entity is already disabled."""
+        return (
+            (unique_id := entity.unique_id) is not None
+            and (
+                entity_id := entity_registry.async_get_entity_id(
+                    self.domain, self.platform_name, unique_id
+                )
+            )
+            is not None
+            and (entry := entity_registry.entities[entity_id]).disabled
+            and entry.config_entry_id
+            == (self.config_entry.entry_id if self.config_entry else None)
+        )
+
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
@@ -722,9 +740,12 @@ class EntityPlatform:
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
 
-        # Update properties before we generate the entity_id. This will happen
-        # also for disabled entities.
-        if update_before_add:
+        # Update properties before we generate the entity_id. Entities whose
+        # registry entry is already disabled are not updated since they will
+        # not be added, their registry entry and device are still refreshed.
+        if update_before_add and not self._async_registry_entry_disabled(
+            entity, entity_registry
+        ):
             try:
                 await entity.async_device_update(warning=False)
             except Exception:
@@ -6,7 +6,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -51,7 +51,7 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import SLOW_TEMPLATE_RATE_LIMIT, RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -69,6 +69,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TRACK_UTC_TIME_CHANGE_DATA: HassKey[dict[_TimeChangeKey, _TrackUTCTimeChange]] = (
+    HassKey("track_utc_time_change_data")
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -83,8 +86,17 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# A template that takes longer than SLOW_TEMPLATE_RENDER_TIME to render
+# SLOW_TEMPLATE_RENDER_COUNT times in a row is rate limited to protect
+# the event loop
+SLOW_TEMPLATE_RENDER_TIME = 0.1  # seconds
+SLOW_TEMPLATE_RENDER_COUNT = 3
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 
+# Matching seconds, minutes, hours and whether local time is used
+type _TimeChangeKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventTracker(Generic[_TypedDictT]):
@@ -950,6 +962,8 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._slow_renders: dict[Template, int] = {}
+        self._slow_templates: set[Template] = set()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -971,6 +985,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._check_render_time(template, info)
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -992,6 +1007,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._check_render_time(template, info)
 
             if info.exception:
                 if not log_fn:
@@ -1016,6 +1032,23 @@ class TrackTemplateResultInfo:
             self.listeners,
             block_render,
         )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            self._log_all_listener_reasons()
+
+    def _log_all_listener_reasons(self) -> None:
+        """Log why templates need to listen for all state changes."""
+        for template, info in self._info.items():
+            if not (info.all_states or info.all_states_lifecycle):
+                continue
+            try:
+                reasons = template.analyze_dependencies().all_states_reasons
+            except TemplateError:
+                continue
+            _LOGGER.debug(
+                "Template %s listens for all state changes because: %s",
+                template.template,
+                "; ".join(reasons) or "states is accessed indirectly",
+            )
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -1095,10 +1128,13 @@ class TrackTemplateResultInfo:
                 return False
 
             had_timer = self._rate_limit.async_has_timer(template)
+            rate_limit = _rate_limit_for_event(event, info, track_template_)
+            if template in self._slow_templates:
+                rate_limit = max(rate_limit or 0, SLOW_TEMPLATE_RATE_LIMIT)
 
             if self._rate_limit.async_schedule_action(
                 template,
-                _rate_limit_for_event(event, info, track_template_),
+                rate_limit,
                 now,
                 self._refresh,
                 event,
@@ -1117,6 +1153,7 @@ class TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._check_render_time(template, info)
 
         try:
             result: str | TemplateError = info.result()
@@ -1134,6 +1171,40 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    def _check_render_time(self, template: Template, info: RenderInfo) -> None:
+        """Rate limit a template that is repeatedly slow to render.
+
+        The rate limit is lifted again once the template renders fast.
+        """
+        if info.render_time < SLOW_TEMPLATE_RENDER_TIME:
+            self._slow_renders.pop(template, None)
+            if template in self._slow_templates:
+                self._slow_templates.discard(template)
+                _LOGGER.debug(
+                    "Template %s renders fast again, it is no longer rate limited",
+                    template.template,
+                )
+            return
+        slow_renders = self._slow_renders[template] = (
+            self._slow_renders.get(template, 0) + 1
+        )
+        if (
+            slow_renders < SLOW_TEMPLATE_RENDER_COUNT
+            or template in self._slow_templates
+        ):
+            return
+        self._slow_templates.add(template)
+        _LOGGER.warning(
+            (
+                "Template %s took longer than %s seconds to render %s times in a"
+                " row, it will be re-rendered at most once every %s seconds"
+            ),
+            template.template,
+            SLOW_TEMPLATE_RENDER_TIME,
+            slow_renders,
+            SLOW_TEMPLATE_RATE_LIMIT,
+        )
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1247,6 +1318,8 @@ class TrackTemplateResultInfo:
                 self.listeners,
                 block_updates,
             )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                self._log_all_listener_reasons()
 
         if not updates:
             return
@@ -1734,12 +1807,21 @@ time_tracker_timestamp = time.time
 
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Track a time pattern for all listeners using the same pattern.
+
+    Listeners with the same pattern share one timer, so they are
+    woken up together instead of each scheduling its own timer.
+    """
+
     hass: HomeAssistant
+    key: _TimeChangeKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[object, HassJob[[datetime], Coroutine[Any, Any, None] | None]] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1756,6 +1838,25 @@ class _TrackUTCTimeChange:
             self._calculate_next(dt_util.utcnow()),
         )
 
+    @callback
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a job to run when the pattern matches."""
+        token = object()
+        self.jobs[token] = job
+        return partial(self._async_remove_job, token)
+
+    @callback
+    def _async_remove_job(self, token: object) -> None:
+        """Remove a job and stop tracking once no jobs are left."""
+        if self.jobs.pop(token, None) is None or self.jobs:
+            return
+        if TYPE_CHECKING:
+            assert self._cancel_callback is not None
+        self._cancel_callback()
+        self.hass.data[_TRACK_UTC_TIME_CHANGE_DATA].pop(self.key)
+
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
@@ -1778,14 +1879,11 @@ class _TrackUTCTimeChange:
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
-
-    @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
-        if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback()
+        jobs = self.jobs
+        for token, job in list(jobs.items()):
+            # A previous job may have removed this one
+            if token in jobs:
+                hass.async_run_hass_job(job, localized_now, background=True)
 
 
 @callback
@@ -1816,21 +1914,30 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    tracks = hass.data.setdefault(_TRACK_UTC_TIME_CHANGE_DATA, {})
+    if (track := tracks.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        # The shared job is named after the action that created the group
+        listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
+        track = tracks[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+        )
+        track.async_attach()
+    return track.async_add_job(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
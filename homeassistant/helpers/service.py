@@ -11,6 +11,7 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -32,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
@@ -482,31 +484,98 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
-@bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
-    hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
-) -> SelectedEntities:
-    """Extract referenced entity IDs from a service call."""
-    selector = ServiceTargetSelector(service_call)
-    selected = SelectedEntities()
+@dataclasses.dataclass(frozen=True, slots=True)
+class _ResolvedTargets:
+    """Registry items resolved from device, area, floor and label targets."""
 
-    if not selector.has_any_selector:
-        return selected
+    indirectly_referenced: frozenset[str]
+    referenced_devices: frozenset[str]
+    referenced_areas: frozenset[str]
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    missing_floors: frozenset[str]
+    missing_labels: frozenset[str]
 
-    entity_ids: set[str] | list[str] = selector.entity_ids
-    if expand_group:
-        entity_ids = expand_entity_ids(hass, entity_ids)
 
-    selected.referenced.update(entity_ids)
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
-    if (
-        not selector.device_ids
-        and not selector.area_ids
-        and not selector.floor_ids
-        and not selector.label_ids
+TARGET_RESOLUTION_CACHE: HassKey[LRU[_TargetKey, _ResolvedTargets]] = HassKey(
+    "service_target_resolution_cache"
+)
+TARGET_RESOLUTION_CACHE_SIZE = 256
+
+# Registry entry fields which change which entities a target resolves to
+_ENTITY_TARGET_FIELDS = {
+    "area_id",
+    "device_id",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+    "labels",
+}
+_DEVICE_TARGET_FIELDS = {"area_id", "labels"}
+
+
+@callback
+def _entity_registry_changes_targets(
+    event_data: entity_registry.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return if an entity registry update may change resolved targets."""
+    return event_data["action"] != "update" or not _ENTITY_TARGET_FIELDS.isdisjoint(
+        event_data["changes"]
+    )
+
+
+@callback
+def _device_registry_changes_targets(
+    event_data: device_registry.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Return if a device registry update may change resolved targets."""
+    return event_data["action"] != "update" or not _DEVICE_TARGET_FIELDS.isdisjoint(
+        event_data["changes"]
+    )
+
+
+@callback
+def _async_get_target_resolution_cache(
+    hass: HomeAssistant,
+) -> LRU[_TargetKey, _ResolvedTargets]:
+    """Return the resolved target cache, cleared on registry changes."""
+    if (resolved_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is not None:
+        return resolved_cache
+    resolved_cache = hass.data[TARGET_RESOLUTION_CACHE] = LRU(
+        TARGET_RESOLUTION_CACHE_SIZE
+    )
+
+    @callback
+    def _async_clear_cache(_: Event[Any]) -> None:
+        """Clear the cache when a registry changes."""
+        resolved_cache.clear()
+
+    hass.bus.async_listen(
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_clear_cache,
+        event_filter=_entity_registry_changes_targets,
+    )
+    hass.bus.async_listen(
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_clear_cache,
+        event_filter=_device_registry_changes_targets,
+    )
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+        label_registry.EVENT_LABEL_REGISTRY_UPDATED,
     ):
-        return selected
+        hass.bus.async_listen(event_type, _async_clear_cache)
+    return resolved_cache
+
 
+def _async_resolve_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> _ResolvedTargets:
+    """Resolve device, area, floor and label targets with the registries."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -563,39 +632,95 @@ def async_extract_referenced_entity_ids(  # noqa: C901
                 for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
             )
 
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+    if selected.referenced_areas or selected.referenced_devices:
+        # Add indirectly referenced by area
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for area_id in selected.referenced_areas
+            # The entity's area matches a targeted area
+            for entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if entry.entity_category is None and entry.hidden_by is None
+        )
+        # Add indirectly referenced by device
+        selected.indirectly_referenced.update(
+            entry.entity_id
+            for device_id in selected.referenced_devices
+            for entry in entities.get_entries_for_device_id(device_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if (
+                entry.entity_category is None
+                and entry.hidden_by is None
+                and (
+                    # The entity's device matches a device referenced
+                    # by an area and the entity
+                    # has no explicitly set area
+                    not entry.area_id
+                    # The entity's device matches a targeted device
+                    or device_id in selector.device_ids
+                )
             )
         )
+
+    return _ResolvedTargets(
+        frozenset(selected.indirectly_referenced),
+        frozenset(selected.referenced_devices),
+        frozenset(selected.referenced_areas),
+        frozenset(selected.missing_devices),
+        frozenset(selected.missing_areas),
+        frozenset(selected.missing_floors),
+        frozenset(selected.missing_labels),
+    )
+
+
+@bind_hass
+def async_extract_referenced_entity_ids(
+    hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
+) -> SelectedEntities:
+    """Extract referenced entity IDs from a service call.
+
+    Device, area, floor and label targets are resolved once and cached
+    until one of the registries changes how they resolve.
+    """
+    selector = ServiceTargetSelector(service_call)
+    selected = SelectedEntities()
+
+    if not selector.has_any_selector:
+        return selected
+
+    entity_ids: set[str] | list[str] = selector.entity_ids
+    if expand_group:
+        entity_ids = expand_entity_ids(hass, entity_ids)
+
+    selected.referenced.update(entity_ids)
+
+    if (
+        not selector.device_ids
+        and not selector.area_ids
+        and not selector.floor_ids
+        and not selector.label_ids
+    ):
+        return selected
+
+    resolved_cache = _async_get_target_resolution_cache(hass)
+    key: _TargetKey = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
     )
+    if (resolved := resolved_cache.get(key)) is None:
+        resolved = resolved_cache[key] = _async_resolve_targets(hass, selector)
+
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
     return selected
 
 
@@ -8,6 +8,7 @@ from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -33,6 +34,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +50,16 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Key of the generation in the snapshot and in each journal record,
+# only records of the generation of the snapshot are replayed
+JOURNAL_GENERATION = "journal_generation"
+# The journal is compacted into a new snapshot once it grows larger
+# than the snapshot or this many bytes, whichever is larger
+JOURNAL_MIN_COMPACT_SIZE = 65536
+
+type _JournalBase = dict[str, bytes | list[bytes]]
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +253,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_writes: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal_writes is set and the data is a dict, saves append the
+        changes since the previous save to a journal next to the storage
+        file instead of rewriting it. The journal is compacted into the
+        storage file when it grows too large and on the final write.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +277,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal_writes = journal_writes
+        self._journal_compact = False
+        # The serialized data as of the last write, used to find the changes
+        # to append to the journal. None if a snapshot must be written.
+        self._journal_base: _JournalBase | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
+        self._journal_generation: str | None = None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -311,7 +343,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_load_data(self):
         """Load the data."""
         # Check if we have a pending write
-        if self._data is not None:
+        pending_write = self._data is not None
+        if pending_write:
             data = self._data
 
             # If we didn't generate data yet, do it now.
@@ -387,6 +420,21 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if (
+            self._journal_writes
+            and not pending_write
+            and isinstance(data.get("data"), dict)
+        ):
+            # The first save after loading writes a snapshot, which
+            # folds the replayed records into the storage file
+            self._journal_base = None
+            if records := await self.hass.async_add_executor_job(
+                self._load_journal, self.journal_path
+            ):
+                _apply_journal(
+                    data["data"], records, data.get(JOURNAL_GENERATION), self.key
+                )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,6 +565,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -551,6 +600,22 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        base: _JournalBase | None = None
+        if self._journal_writes and isinstance(data["data"], dict):
+            try:
+                base = self._serialize_journal_base(data["data"])
+            except TypeError:
+                # save_json will log where the unserializable data is
+                self._journal_base = None
+            else:
+                if self._write_journal(data["data"], base):
+                    return
+
+        if self._journal_writes:
+            # A journal left behind by a crash before it was removed below
+            # belongs to an older generation and is not replayed
+            self._journal_generation = data[JOURNAL_GENERATION] = ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +625,116 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal_writes:
+            self._journal_base = base
+            self._journal_size = 0
+            self._snapshot_size = os.path.getsize(path)
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+
+    def _dump_journal_value(self, value: Any) -> bytes:
+        """Serialize a value the same way the snapshot does."""
+        if self._encoder and self._encoder is not JSONEncoder:
+            return json.dumps(value, cls=self._encoder).encode("utf-8")
+        return json_helper.json_bytes(value)
+
+    def _serialize_journal_base(self, stored: dict[str, Any]) -> _JournalBase:
+        """Serialize the values and list items of the data to compare."""
+        dump = self._dump_journal_value
+        return {
+            key: [dump(item) for item in value]
+            if isinstance(value, list)
+            else dump(value)
+            for key, value in stored.items()
+        }
+
+    def _write_journal(self, stored: dict[str, Any], base: _JournalBase) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if a snapshot needs to be written instead.
+        """
+        old_base = self._journal_base
+        compact = self._journal_compact
+        self._journal_compact = False
+        if old_base is None or compact:
+            return False
+
+        replace: dict[str, json_helper.json_fragment] = {}
+        patch: dict[str, tuple[int, dict[int, json_helper.json_fragment]]] = {}
+        for key, value in base.items():
+            old_value = old_base.get(key)
+            if isinstance(value, list) and isinstance(old_value, list):
+                old_len = len(old_value)
+                items = {
+                    idx: json_helper.json_fragment(item)
+                    for idx, item in enumerate(value)
+                    if idx >= old_len or item != old_value[idx]
+                }
+                if items or old_len != len(value):
+                    patch[key] = (len(value), items)
+            elif value != old_value:
+                replace[key] = json_helper.json_fragment(
+                    b"[" + b",".join(value) + b"]" if isinstance(value, list) else value
+                )
+        delete = [key for key in old_base if key not in base]
+        if not replace and not patch and not delete:
+            return True
+
+        record = json_helper.json_bytes(
+            {
+                "generation": self._journal_generation,
+                "replace": replace,
+                "patch": patch,
+                "delete": delete,
+            }
+        )
+        if self._journal_size + len(record) > max(
+            self._snapshot_size, JOURNAL_MIN_COMPACT_SIZE
+        ):
+            return False
+
+        _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+        mode = 0o600 if self._private else 0o644
+        try:
+            with open(
+                self.journal_path,
+                "ab",
+                opener=lambda path, flags: os.open(path, flags, mode),
+            ) as fdesc:
+                fdesc.write(record + b"\n")
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as error:
+            # The journal may end with a partial record now,
+            # write a snapshot next time to get rid of it
+            self._journal_base = None
+            _LOGGER.exception("Saving file failed: %s", self.journal_path)
+            raise WriteError(error) from error
+
+        self._journal_base = base
+        self._journal_size += len(record) + 1
+        return True
+
+    def _load_journal(self, path: str) -> list[dict[str, Any]]:
+        """Load the records appended to the journal."""
+        try:
+            with open(path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return []
+        records: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                records.append(json_util.json_loads_object(line))
+            except ValueError:
+                # An unclean shutdown can leave a partial record at the end
+                _LOGGER.warning(
+                    "Ignoring incomplete journal record for %s in %s", self.key, path
+                )
+                break
+        return records
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +747,37 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal_writes:
+            self._journal_base = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _apply_journal(
+    stored: dict[str, Any],
+    records: list[dict[str, Any]],
+    generation: str | None,
+    storage_key: str,
+) -> None:
+    """Apply journal records to the data loaded from the snapshot.
+
+    Records of another generation were written against an older snapshot
+    and are skipped.
+    """
+    stale = 0
+    for record in records:
+        if generation is None or record.get("generation") != generation:
+            stale += 1
+            continue
+        for key in record["delete"]:
+            stored.pop(key, None)
+        stored.update(record["replace"])
+        for key, (length, items) in record["patch"].items():
+            values: list[Any] = stored.setdefault(key, [])
+            del values[length:]
+            values.extend([None] * (length - len(values)))
+            for idx, item in items.items():
+                values[int(idx)] = item
+    if stale:
+        _LOGGER.debug("Skipped %s stale journal records for %s", stale, storage_key)
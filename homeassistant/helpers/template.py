@@ -5,6 +5,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from bisect import bisect_left
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
@@ -21,6 +22,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import monotonic
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -98,6 +100,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_RENDER_TIMES: HassKey[LRU[str, RenderTimeHistogram]] = HassKey("template.render_times")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -122,6 +125,12 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
+SLOW_TEMPLATE_RATE_LIMIT = 10  # seconds
+
+# Upper bounds of the render time histogram buckets
+RENDER_TIME_BUCKETS = (0.001, 0.01, 0.1, 1.0, math.inf)  # seconds
+# Number of templates render times are kept for
+RENDER_TIMES_SIZE = 1000
 
 _render_info: ContextVar[RenderInfo | None] = ContextVar("_render_info", default=None)
 
@@ -218,6 +227,40 @@ def attach(hass: HomeAssistant, obj: Any) -> None:
         obj.hass = hass
 
 
+@callback
+def async_get_render_times(
+    hass: HomeAssistant, templates: Iterable[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """Return the render time histograms of templates tracking their dependencies.
+
+    If templates is not given, the histograms of all templates are returned.
+    """
+    if (render_times := hass.data.get(_RENDER_TIMES)) is None:
+        return {}
+    if templates is None:
+        return {source: hist.as_dict() for source, hist in render_times.items()}
+    result: dict[str, dict[str, Any]] = {}
+    for template in templates:
+        source = template.strip()
+        if (hist := render_times.get(source)) is not None:
+            result[source] = hist.as_dict()
+    return result
+
+
+@callback
+def async_get_cache_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return statistics about the compiled templates shared by the environments."""
+    return {
+        name: env.cache_stats()
+        for name, key in (
+            ("default", _ENVIRONMENT),
+            ("limited", _ENVIRONMENT_LIMITED),
+            ("strict", _ENVIRONMENT_STRICT),
+        )
+        if (env := hass.data.get(key)) is not None
+    }
+
+
 def render_complex(
     value: Any,
     variables: TemplateVarsType = None,
@@ -356,6 +399,37 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+class RenderTimeHistogram:
+    """Histogram of the time it takes to render a template."""
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.counts = [0] * len(RENDER_TIME_BUCKETS)
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, render_time: float) -> None:
+        """Add a render time."""
+        self.counts[bisect_left(RENDER_TIME_BUCKETS, render_time)] += 1
+        self.total += render_time
+        if render_time > self.max:
+            self.max = render_time
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": sum(self.counts),
+            "total": self.total,
+            "max": self.max,
+            "buckets": {
+                str(bound): count
+                for bound, count in zip(RENDER_TIME_BUCKETS, self.counts, strict=True)
+            },
+        }
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -373,6 +447,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "render_time",
     )
 
     def __init__(self, template: Template) -> None:
@@ -391,6 +466,7 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        self.render_time = 0.0
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -476,6 +552,183 @@ class RenderInfo:
             self.filter = _false
 
 
+# Functions and filters that take a single entity_id as first argument
+_ENTITY_ID_FUNCTIONS = frozenset(
+    {
+        "has_value",
+        "is_state",
+        "is_state_attr",
+        "state_attr",
+        "state_translated",
+        "states",
+    }
+)
+
+
+class TemplateDependencies:
+    """Holds the state dependencies found by analyzing a template's source.
+
+    Unlike RenderInfo, which only records what a single render touched,
+    this covers every branch of the template but can only see literal
+    entity_ids and domains.
+    """
+
+    __slots__ = ("entities", "domains", "all_states_reasons")
+
+    def __init__(
+        self,
+        entities: frozenset[str],
+        domains: frozenset[str],
+        all_states_reasons: tuple[str, ...],
+    ) -> None:
+        """Initialise."""
+        self.entities = entities
+        self.domains = domains
+        self.all_states_reasons = all_states_reasons
+
+    def __repr__(self) -> str:
+        """Representation of TemplateDependencies."""
+        return (
+            f"<TemplateDependencies entities={set(self.entities)}"
+            f" domains={set(self.domains)}"
+            f" all_states_reasons={list(self.all_states_reasons)}"
+            ">"
+        )
+
+
+class _DependencyCollector:
+    """Walk a Jinja AST collecting literal state references."""
+
+    __slots__ = ("entities", "domains", "all_states_reasons")
+
+    def __init__(self) -> None:
+        """Initialise."""
+        self.entities: set[str] = set()
+        self.domains: set[str] = set()
+        self.all_states_reasons: list[str] = []
+
+    def visit(self, node: jinja2.nodes.Node) -> None:
+        """Visit a node and its children."""
+        if isinstance(node, jinja2.nodes.Name):
+            if node.name == "states" and node.ctx == "load":
+                self.all_states_reasons.append(
+                    f"line {node.lineno}: states is used as a collection"
+                )
+            return
+        if isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem)):
+            if self._visit_states_lookup(node):
+                return
+        elif isinstance(node, jinja2.nodes.Call):
+            if isinstance(func := node.node, jinja2.nodes.Name):
+                if func.name in _ENTITY_ID_FUNCTIONS and node.args:
+                    self._add_entity_arg(node.args[0])
+                    self._visit_nodes(node.args[1:], node.kwargs)
+                    return
+                if func.name == "expand":
+                    self._visit_expand(node)
+                    return
+        elif isinstance(node, (jinja2.nodes.Filter, jinja2.nodes.Test)):
+            if node.name in _ENTITY_ID_FUNCTIONS and node.node is not None:
+                self._add_entity_arg(node.node)
+                self._visit_nodes(node.args, node.kwargs)
+                return
+            if node.name == "expand" and node.node is not None:
+                self._visit_expand_arg(node.node)
+                self._visit_nodes(node.args, node.kwargs)
+                return
+        self._visit_nodes(node.iter_child_nodes())
+
+    def _visit_nodes(self, *node_lists: Iterable[jinja2.nodes.Node]) -> None:
+        """Visit a list of nodes."""
+        for node_list in node_lists:
+            for node in node_list:
+                self.visit(node)
+
+    def _add_entity_arg(self, node: jinja2.nodes.Node) -> None:
+        """Add an entity_id argument if it is a literal."""
+        if not (
+            isinstance(node, jinja2.nodes.Const)
+            and isinstance(node.value, str)
+            and self._add_entity_id(node.value)
+        ):
+            self.visit(node)
+
+    def _add_entity_id(self, entity_id: str) -> bool:
+        """Add an entity_id if it is valid."""
+        if not valid_entity_id(entity_id):
+            return False
+        self.entities.add(entity_id)
+        return True
+
+    def _visit_expand(self, node: jinja2.nodes.Call) -> None:
+        """Visit a call to expand."""
+        for arg in node.args:
+            self._visit_expand_arg(arg)
+        self._visit_nodes(node.kwargs)
+        if node.dyn_args is not None:
+            self.visit(node.dyn_args)
+
+    def _visit_expand_arg(self, node: jinja2.nodes.Node) -> None:
+        """Visit an argument of expand, which may be a list of entity_ids."""
+        if isinstance(node, (jinja2.nodes.List, jinja2.nodes.Tuple)):
+            for item in node.items:
+                self._add_entity_arg(item)
+        else:
+            self._add_entity_arg(node)
+
+    def _visit_states_lookup(
+        self, node: jinja2.nodes.Getattr | jinja2.nodes.Getitem
+    ) -> bool:
+        """Visit a states.domain or states.domain.object_id lookup.
+
+        Returns False if the node is not a lookup on states.
+        """
+        inner = node.node
+        if _is_states_name(inner):
+            if (key := _lookup_key(node)) is None:
+                # The render will track whatever the lookup resolves to
+                self._visit_lookup_arg(node)
+            elif "." in key:
+                self._add_entity_id(key)
+            else:
+                # The whole domain is iterated or counted
+                self.domains.add(key)
+            return True
+        if isinstance(
+            inner, (jinja2.nodes.Getattr, jinja2.nodes.Getitem)
+        ) and _is_states_name(inner.node):
+            domain = _lookup_key(inner)
+            object_id = _lookup_key(node)
+            if domain is None or object_id is None:
+                self._visit_lookup_arg(inner)
+                self._visit_lookup_arg(node)
+            else:
+                self._add_entity_id(f"{domain}.{object_id}")
+            return True
+        return False
+
+    def _visit_lookup_arg(
+        self, node: jinja2.nodes.Getattr | jinja2.nodes.Getitem
+    ) -> None:
+        """Visit the argument of a lookup without visiting what is looked up."""
+        if isinstance(node, jinja2.nodes.Getitem):
+            self.visit(node.arg)
+
+
+def _is_states_name(node: jinja2.nodes.Node) -> bool:
+    """Return if the node is a reference to states."""
+    return isinstance(node, jinja2.nodes.Name) and node.name == "states"
+
+
+def _lookup_key(node: jinja2.nodes.Getattr | jinja2.nodes.Getitem) -> str | None:
+    """Return the literal attribute or item of a lookup."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr
+    if isinstance(node.arg, jinja2.nodes.Const) and isinstance(node.arg.value, str):
+        return node.arg.value
+    return None
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -486,6 +739,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_dependencies",
         "_exc_info",
         "_limited",
         "_strict",
@@ -502,6 +756,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._dependencies: TemplateDependencies | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -537,17 +792,46 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if compiled := env.template_cache.get(self.template):
+            env.compile_hits += 1
             self._compiled_code = compiled
             return
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
+    def analyze_dependencies(self) -> TemplateDependencies:
+        """Return the state dependencies found in the template source.
+
+        The result explains why a template needs to listen for all
+        state changes, which cannot be seen from a single render.
+        """
+        if self._dependencies is not None:
+            return self._dependencies
+
+        if self.is_static:
+            self._dependencies = TemplateDependencies(frozenset(), frozenset(), ())
+            return self._dependencies
+
+        try:
+            ast = self._env.parse(self.template)
+        except jinja2.TemplateError as err:
+            raise TemplateError(err) from err
+
+        collector = _DependencyCollector()
+        collector.visit(ast)
+        self._dependencies = TemplateDependencies(
+            frozenset(collector.entities),
+            frozenset(collector.domains),
+            tuple(collector.all_states_reasons),
+        )
+        return self._dependencies
+
     def render(
         self,
         variables: TemplateVarsType = None,
@@ -711,6 +995,7 @@ class Template:
             return render_info
 
         token = _render_info.set(render_info)
+        start = monotonic()
         try:
             render_info._result = self.async_render(  # noqa: SLF001
                 variables, strict=strict, log_fn=log_fn, **kwargs
@@ -719,10 +1004,22 @@ class Template:
             render_info.exception = ex
         finally:
             _render_info.reset(token)
+            render_info.render_time = monotonic() - start
 
         render_info._freeze()  # noqa: SLF001
+        self._async_add_render_time(render_info.render_time)
         return render_info
 
+    @callback
+    def _async_add_render_time(self, render_time: float) -> None:
+        """Add a render time to the histogram of this template."""
+        assert self.hass is not None
+        if (render_times := self.hass.data.get(_RENDER_TIMES)) is None:
+            render_times = self.hass.data[_RENDER_TIMES] = LRU(RENDER_TIMES_SIZE)
+        if (hist := render_times.get(self.template)) is None:
+            hist = render_times[self.template] = RenderTimeHistogram()
+        hist.add(render_time)
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -813,11 +1110,18 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Identical templates, for example from the same blueprint,
+        # share one bound template object
+        if (compiled := env.bound_template_cache.get(self.template)) is not None:
+            env.bind_hits += 1
+        else:
+            compiled = jinja2.Template.from_code(
+                env, self._compiled_code, env.globals, None
+            )
+            env.bound_template_cache[self.template] = compiled
+        self._compiled = compiled
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -2738,6 +3042,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.bound_template_cache: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
+        self.compile_hits = 0
+        self.compile_misses = 0
+        self.compile_time = 0.0
+        self.bind_hits = 0
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3085,9 +3396,27 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
+        start = monotonic()
         compiled = super().compile(source)
+        self.compile_time += monotonic() - start
+        self.compile_misses += 1
         self.template_cache[source] = compiled
         return compiled
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Return statistics about the compiled template caches."""
+        avg_compile_time = (
+            self.compile_time / self.compile_misses if self.compile_misses else 0.0
+        )
+        return {
+            "compiled_templates": len(self.template_cache),
+            "bound_templates": len(self.bound_template_cache),
+            "compile_hits": self.compile_hits,
+            "compile_misses": self.compile_misses,
+            "compile_time": self.compile_time,
+            "compile_time_saved": self.compile_hits * avg_compile_time,
+            "bind_hits": self.bind_hits,
+        }
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
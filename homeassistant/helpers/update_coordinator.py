@@ -5,12 +5,14 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
-from random import randint
+from random import randint, uniform
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
+import weakref
 
 import aiohttp
 import requests
@@ -25,6 +27,7 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
@@ -32,6 +35,10 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+_ADAPTIVE_POLLING_COORDINATORS: HassKey[weakref.WeakSet[DataUpdateCoordinator[Any]]] = (
+    HassKey("update_coordinator_adaptive_polling")
+)
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -44,6 +51,28 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(frozen=True, slots=True)
+class AdaptivePolling:
+    """Limits for adapting the polls of a coordinator to its data.
+
+    The first poll is spread across the update interval and every later
+    poll is jittered so that coordinators set up at the same time do
+    not poll on the same second. The change rate of the data is
+    estimated with an exponential moving average. While it is below
+    min_change_rate the interval is multiplied by backoff_factor up to
+    max_interval, and it is reset to the update interval as soon as
+    the data changes.
+
+    The data must implement ``__eq__`` to detect changes.
+    """
+
+    max_interval: timedelta
+    backoff_factor: float = 2.0
+    min_change_rate: float = 0.2
+    change_rate_smoothing: float = 0.25
+    jitter: float = 0.1
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -72,13 +101,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        adaptive_polling: AdaptivePolling | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
         self.logger = logger
         self.name = name
         self.update_method = update_method
+        self.adaptive_polling = adaptive_polling
         self._update_interval_seconds: float | None = None
+        self._adaptive_interval_seconds: float | None = None
         self.update_interval = update_interval
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
@@ -104,6 +136,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.last_update_success = True
         self.last_exception: Exception | None = None
 
+        self._change_rate = 1.0
+        self._spread_next_poll = True
+        self._polls = 0
+        self._skipped_polls = 0.0
+        self._poll_interval_seconds = 0.0
+        self._updates = 0
+        self._update_seconds = 0.0
+        if adaptive_polling is not None:
+            hass.data.setdefault(_ADAPTIVE_POLLING_COORDINATORS, weakref.WeakSet()).add(
+                self
+            )
+
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
                 hass,
@@ -170,6 +214,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
+        if self.adaptive_polling is not None and (
+            coordinators := self.hass.data.get(_ADAPTIVE_POLLING_COORDINATORS)
+        ):
+            coordinators.discard(self)
 
     @callback
     def _unschedule_refresh(self) -> None:
@@ -205,6 +253,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Set interval between updates."""
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
+        self._adaptive_interval_seconds = self._update_interval_seconds
 
     @callback
     def _schedule_refresh(self) -> None:
@@ -225,13 +274,70 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        if self.adaptive_polling is not None:
+            next_refresh = loop.time() + self._async_next_adaptive_delay()
+        else:
+            next_refresh = (
+                int(loop.time()) + self._microsecond + self._update_interval_seconds
+            )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
 
+    @callback
+    def _async_next_adaptive_delay(self) -> float:
+        """Return the delay until the next poll with adaptive polling."""
+        assert self.adaptive_polling is not None
+        assert self._update_interval_seconds is not None
+        interval = self._adaptive_interval_seconds or self._update_interval_seconds
+        self._poll_interval_seconds = interval
+        if self._spread_next_poll:
+            self._spread_next_poll = False
+            return interval * uniform(0.5, 1.5)
+        jitter = self.adaptive_polling.jitter
+        return interval * uniform(1 - jitter, 1 + jitter)
+
+    @callback
+    def _async_track_data_change(self, changed: bool) -> None:
+        """Update the change rate and back off or tighten the poll interval."""
+        adaptive_polling = self.adaptive_polling
+        assert adaptive_polling is not None
+        if (update_interval_seconds := self._update_interval_seconds) is None:
+            return
+        self._change_rate += adaptive_polling.change_rate_smoothing * (
+            changed - self._change_rate
+        )
+        if changed:
+            self._adaptive_interval_seconds = update_interval_seconds
+        elif self._change_rate < adaptive_polling.min_change_rate:
+            self._adaptive_interval_seconds = min(
+                (self._adaptive_interval_seconds or update_interval_seconds)
+                * adaptive_polling.backoff_factor,
+                max(
+                    adaptive_polling.max_interval.total_seconds(),
+                    update_interval_seconds,
+                ),
+            )
+
+    @callback
+    def async_get_adaptive_polling_diagnostics(self) -> dict[str, Any]:
+        """Return the poll counts and savings of adaptive polling."""
+        average_update_seconds = (
+            self._update_seconds / self._updates if self._updates else 0.0
+        )
+        return {
+            "name": self.name,
+            "update_interval": self._update_interval_seconds,
+            "current_interval": self._adaptive_interval_seconds,
+            "change_rate": round(self._change_rate, 3),
+            "polls": self._polls,
+            "skipped_polls": int(self._skipped_polls),
+            "average_update_seconds": round(average_update_seconds, 6),
+            "saved_update_seconds": round(
+                int(self._skipped_polls) * average_update_seconds, 3
+            ),
+        }
+
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
         """Handle a refresh interval occurrence."""
@@ -252,6 +358,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        self._polls += 1
+        if self.adaptive_polling is not None and self._update_interval_seconds:
+            # Count the polls saved by backing off compared to the update interval
+            self._skipped_polls += (
+                self._poll_interval_seconds / self._update_interval_seconds - 1
+            )
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
@@ -301,7 +413,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
+        adaptive_polling = self.adaptive_polling
+        if (
+            log_timing := self.logger.isEnabledFor(logging.DEBUG)
+        ) or adaptive_polling is not None:
             start = monotonic()
 
         auth_failed = False
@@ -386,6 +501,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
+            if adaptive_polling is not None:
+                self._updates += 1
+                self._update_seconds += monotonic() - start
+                self._async_track_data_change(previous_data != self.data)
 
         finally:
             if log_timing:
@@ -447,6 +566,22 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.async_update_listeners()
 
 
+@callback
+def async_get_adaptive_polling_diagnostics(
+    hass: HomeAssistant, entry_id: str
+) -> list[dict[str, Any]]:
+    """Return adaptive polling diagnostics for the coordinators of a config entry."""
+    return sorted(
+        (
+            coordinator.async_get_adaptive_polling_diagnostics()
+            for coordinator in hass.data.get(_ADAPTIVE_POLLING_COORDINATORS, ())
+            if coordinator.config_entry
+            and coordinator.config_entry.entry_id == entry_id
+        ),
+        key=lambda diagnostics: diagnostics["name"],
+    )
+
+
 class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
     """DataUpdateCoordinator which keeps track of the last successful update."""
 
@@ -761,6 +761,9 @@ class Integration:
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
+        # Seconds it took async_get_component to import the component,
+        # None until it has been imported by async_get_component
+        self.import_seconds: float | None = None
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @cached_property
@@ -967,8 +970,7 @@ class Integration:
         if self._component_future:
             return await self._component_future
 
-        if debug := _LOGGER.isEnabledFor(logging.DEBUG):
-            start = time.perf_counter()
+        start = time.perf_counter()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -978,12 +980,12 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
-            if debug:
-                _LOGGER.debug(
-                    "Component %s import took %.3f seconds (loaded_executor=False)",
-                    self.domain,
-                    time.perf_counter() - start,
-                )
+            self.import_seconds = time.perf_counter() - start
+            _LOGGER.debug(
+                "Component %s import took %.3f seconds (loaded_executor=False)",
+                self.domain,
+                self.import_seconds,
+            )
             return comp
 
         self._component_future = self.hass.loop.create_future()
@@ -1014,13 +1016,13 @@ class Integration:
         finally:
             self._component_future = None
 
-        if debug:
-            _LOGGER.debug(
-                "Component %s import took %.3f seconds (loaded_executor=%s)",
-                self.domain,
-                time.perf_counter() - start,
-                load_executor,
-            )
+        self.import_seconds = time.perf_counter() - start
+        _LOGGER.debug(
+            "Component %s import took %.3f seconds (loaded_executor=%s)",
+            self.domain,
+            self.import_seconds,
+            load_executor,
+        )
 
         return comp
 
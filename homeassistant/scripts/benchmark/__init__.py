@@ -7,9 +7,17 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import json
 import logging
+import os
+import sys
+import tempfile
+import time
 from timeit import default_timer as timer
+import types
+import zlib
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -19,6 +27,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -312,6 +321,479 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _recorder_benchmark_engine():
+    """Return an engine for the database recorder benchmarks run against.
+
+    The default in-memory SQLite database is shared by all threads so
+    it can be filled and queried from different executor jobs.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.pool import StaticPool
+
+    if db_url := os.environ.get("BENCHMARK_RECORDER_DB_URL"):
+        return create_engine(db_url, future=True)
+    return create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+
+
+@benchmark
+async def recorder_bulk_insert_states(hass):
+    """Commit 100k states with the ORM and with the bulk insert path.
+
+    The states are committed in batches of 1000 states of 100 entities,
+    so each batch has ten states per entity linked by old_state and one
+    in ten states has new attributes, as the recorder would queue them.
+    The bulk insert path is the one the recorder uses when bulk_insert
+    is enabled.
+
+    The database defaults to an in-memory SQLite database, a MariaDB or
+    PostgreSQL server can be used by setting BENCHMARK_RECORDER_DB_URL.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import delete
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.core import _bulk_insert_states
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    rows_to_insert = 10**5
+    rows_per_commit = 1000
+    entities = 100
+    engine = _recorder_benchmark_engine()
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entities)
+        ]
+        session.add_all(states_meta)
+        session.commit()
+        metadata_ids = [meta.metadata_id for meta in states_meta]
+
+    def _insert(bulk: bool) -> float:
+        runtime = 0.0
+        last_states: dict[int, States] = {}
+        with Session(engine, expire_on_commit=False) as session:
+            for first_idx in range(0, rows_to_insert, rows_per_commit):
+                new_attributes: list[StateAttributes] = []
+                pending: list[States] = []
+                for idx in range(first_idx, first_idx + rows_per_commit):
+                    entity = idx % entities
+                    dbstate = States(
+                        state=str(idx),
+                        last_updated_ts=float(idx),
+                        metadata_id=metadata_ids[entity],
+                        origin_idx=0,
+                    )
+                    if (old_state := last_states.get(entity)) is not None:
+                        if old_state.state_id is None:
+                            dbstate.old_state = old_state
+                        else:
+                            dbstate.old_state_id = old_state.state_id
+                    last_states[entity] = dbstate
+                    if idx % 10 == 0:
+                        state_attributes = StateAttributes(
+                            shared_attrs=f'{{"idx":{idx}}}', hash=idx
+                        )
+                        new_attributes.append(state_attributes)
+                        dbstate.state_attributes = state_attributes
+                    pending.append(dbstate)
+                start = timer()
+                session.add_all(new_attributes)
+                if bulk:
+                    with session.no_autoflush:
+                        _bulk_insert_states(session, pending)
+                else:
+                    session.add_all(pending)
+                session.commit()
+                runtime += timer() - start
+                session.expunge_all()
+        return runtime
+
+    def _clear() -> None:
+        with Session(engine) as session:
+            session.execute(delete(States))
+            session.execute(delete(StateAttributes))
+            session.commit()
+
+    orm_time = await hass.async_add_executor_job(_insert, False)
+    await hass.async_add_executor_job(_clear)
+    bulk_time = await hass.async_add_executor_job(_insert, True)
+    engine.dispose()
+    print(
+        f"{engine.dialect.name}: ORM {rows_to_insert / orm_time:.0f} rows/s,"
+        f" bulk {rows_to_insert / bulk_time:.0f} rows/s"
+    )
+    return bulk_time
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 5k messages against 1k wildcard subscriptions.
+
+    The linear scan over a paho matcher per subscription is timed
+    first for comparison. Every message uses a distinct topic so the
+    matching subscriptions cache does not hide the matching cost.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    job = core.HassJob(lambda msg: None)
+    subscriptions = [
+        Subscription(topic, False, job)
+        for idx in range(250)
+        for topic in (
+            f"zigbee2mqtt/device_{idx}/+",
+            f"tasmota/discovery/{idx}/#",
+            f"homeassistant/+/device_{idx}/+/config",
+            f"esphome/node_{idx}/+/+/state",
+        )
+    ]
+    topics = [
+        f"zigbee2mqtt/device_{idx % 250}/set"
+        if idx % 2
+        else f"homeassistant/sensor/device_{idx % 250}/object_{idx}/config"
+        for idx in range(5000)
+    ]
+
+    matchers = []
+    for subscription in subscriptions:
+        matcher = MQTTMatcher()
+        matcher[subscription.topic] = True
+        matchers.append((subscription, matcher))
+
+    start = timer()
+    linear_matches = [
+        [
+            subscription
+            for subscription, matcher in matchers
+            if next(matcher.iter_match(topic), False)
+        ]
+        for topic in topics
+    ]
+    linear_time = timer() - start
+
+    trie = SubscriptionTrie()
+    for subscription in subscriptions:
+        trie.add(subscription)
+
+    start = timer()
+    trie_matches = [trie.match(topic) for topic in topics]
+    trie_time = timer() - start
+
+    assert [len(matches) for matches in linear_matches] == [
+        len(matches) for matches in trie_matches
+    ]
+    print(f"Linear scan {linear_time}s, trie {trie_time}s")
+    return trie_time
+
+
+@benchmark
+async def sensor_statistics_compile(hass):
+    """Normalize and average a 5-minute period of 5k power sensors.
+
+    Half of the sensors report in kW and are converted to the W
+    statistics unit. Each sensor has a state every 10 seconds.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import LazyState, StatisticMetaData
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import (
+        _entity_history_to_float_and_state,
+        _normalize_states,
+        _time_weighted_average,
+    )
+
+    row = collections.namedtuple("Row", ["attributes"])
+    period_start = dt_util.utcnow().replace(second=0, microsecond=0)
+    period_end = period_start + timedelta(minutes=5)
+    start_ts = period_start.timestamp()
+    attr_cache = {}
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]] = {}
+    histories = {}
+    for idx in range(5000):
+        entity_id = f"sensor.power_{idx}"
+        unit = "kW" if idx % 2 else "W"
+        attributes = row(json.dumps({"unit_of_measurement": unit}))
+        old_metadatas[entity_id] = (
+            idx,
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": entity_id,
+                "unit_of_measurement": "W",
+            },
+        )
+        histories[entity_id] = _entity_history_to_float_and_state(
+            LazyState(
+                attributes,
+                attr_cache,
+                None,
+                entity_id,
+                str(idx + offset),
+                start_ts + offset * 10,
+                False,
+            )
+            for offset in range(30)
+        )
+
+    start = timer()
+    for entity_id, fstates in histories.items():
+        _, valid_fstates = _normalize_states(hass, old_metadatas, fstates, entity_id)
+        _time_weighted_average(valid_fstates, period_start, period_end)
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_journal_writes(hass):
+    """Save an hour of changes to an entity registry with 10k entities.
+
+    The registry is saved every 10 seconds with one changed entity,
+    once rewriting the whole file and once with journal writes.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    entities = [
+        {
+            "area_id": None,
+            "config_entry_id": f"{idx // 100:032x}",
+            "device_id": f"{idx // 4:032x}",
+            "disabled_by": None,
+            "entity_id": f"sensor.benchmark_{idx}",
+            "id": f"{idx:032x}",
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "platform": "benchmark",
+            "unique_id": f"benchmark-{idx}",
+        }
+        for idx in range(10000)
+    ]
+    data = {"entities": entities, "deleted_entities": []}
+    saves = 360
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for journal_writes in (False, True):
+            store = Store(
+                hass,
+                1,
+                f"core.entity_registry.{journal_writes}",
+                atomic_writes=True,
+                journal_writes=journal_writes,
+            )
+            await store.async_save(data)
+            written = 0
+            runtime = 0.0
+            for change in range(saves):
+                entities[change]["name"] = f"Benchmark {change}"
+                journal_size = (
+                    os.path.getsize(store.journal_path)
+                    if os.path.exists(store.journal_path)
+                    else 0
+                )
+                start = timer()
+                await store.async_save(data)
+                runtime += timer() - start
+                if os.path.exists(store.journal_path):
+                    written += os.path.getsize(store.journal_path) - journal_size
+                else:
+                    written += os.path.getsize(store.path)
+            print(
+                f"journal_writes={journal_writes}: {written} bytes written per hour,"
+                f" {runtime / saves * 1000:.2f}ms per save"
+            )
+    return runtime
+
+
+@benchmark
+async def websocket_subscribe_entities_fan_out(hass):
+    """Send 500 state changes per second to 50 subscribe_entities clients.
+
+    30 clients subscribe to all entities and 20 to the same 50
+    entities, as wall tablets showing the same dashboard would.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import _EntitySubscriptions
+
+    sent = 0
+
+    def send_message(message):
+        nonlocal sent
+        sent += 1
+
+    user = User(name="benchmark", is_owner=True, is_active=True, system_generated=False)
+    subscriptions = _EntitySubscriptions(hass)
+    dashboard = {f"sensor.benchmark_{idx}" for idx in range(50)}
+    for msg_id in range(50):
+        subscriptions.async_subscribe(
+            dashboard if msg_id % 5 < 2 else set(),
+            (send_message, user, str(msg_id).encode()),
+        )
+
+    seconds = 10
+    start_cpu = time.process_time()
+    start = timer()
+    for second in range(seconds):
+        for idx in range(500):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx}",
+                str(second),
+                {"unit_of_measurement": "W"},
+            )
+        await hass.async_block_till_done()
+    runtime = timer() - start
+    cpu_per_event = (time.process_time() - start_cpu) / (seconds * 500)
+    print(f"{sent} messages sent, {cpu_per_event * 1e6:.1f}us CPU per event")
+    return runtime
+
+
+@benchmark
+async def websocket_get_states_encode(hass):
+    """Encode the get_states result for 5k entities.
+
+    Reports the frame size and the size after permessage-deflate.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        construct_result_list_message,
+        construct_result_message,
+    )
+
+    for idx in range(5000):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            str(idx),
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "friendly_name": f"Benchmark {idx}",
+            },
+        )
+    serialized_states = [state.as_dict_json for state in hass.states.async_all()]
+
+    start = timer()
+    for msg_id in range(100):
+        construct_result_message(
+            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+        )
+    nested_runtime = timer() - start
+
+    start = timer()
+    for msg_id in range(100):
+        message = construct_result_list_message(msg_id, serialized_states)
+    runtime = timer() - start
+
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    deflated = compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    print(f"Nested joins: {nested_runtime / 100 * 1000:.2f}ms per message")
+    print(f"Single join: {runtime / 100 * 1000:.2f}ms per message")
+    print(f"Frame size: {len(message)} bytes, {len(deflated)} bytes deflated")
+    return runtime
+
+
+def _deep_getsizeof(objs) -> int:
+    """Return the bytes held by objs and everything they reference once."""
+    seen = set()
+    size = 0
+    pending = list(objs)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(
+            obj, (type, types.ModuleType, types.FunctionType)
+        ):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Report the bytes held by hass.states for 10k synthetic entities.
+
+    Every entity changes state a few times with unchanged attributes
+    and the JSON forms are built as websocket subscribers would. The
+    result is compared to states that each hold their own attributes
+    and JSON forms.
+    """
+    attributes_by_domain = {
+        "sensor": {
+            "state_class": "measurement",
+            "unit_of_measurement": "W",
+            "device_class": "power",
+        },
+        "binary_sensor": {"device_class": "motion"},
+        "light": {
+            "supported_color_modes": ["brightness"],
+            "color_mode": "brightness",
+            "brightness": 255,
+            "supported_features": 40,
+        },
+        "switch": {},
+        "button": {},
+    }
+    domains = list(attributes_by_domain)
+    start = timer()
+    for idx in range(10000):
+        domain = domains[idx % len(domains)]
+        attributes = attributes_by_domain[domain]
+        if idx % 2:
+            attributes = {**attributes, "friendly_name": f"Benchmark {idx}"}
+        for value in range(5):
+            hass.states.async_set(f"{domain}.benchmark_{idx}", str(value), attributes)
+            state = hass.states.get(f"{domain}.benchmark_{idx}")
+            state.as_dict_json  # noqa: B018
+            state.as_compressed_state_json  # noqa: B018
+    runtime = timer() - start
+
+    states = hass.states.async_all()
+    unshared = []
+    for state in states:
+        copy = core.State(
+            state.entity_id,
+            state.state,
+            json.loads(json.dumps(state.attributes)),
+            state.last_changed,
+            state.last_reported,
+            state.last_updated,
+            state.context,
+        )
+        copy.as_dict_json  # noqa: B018
+        copy.as_compressed_state_json  # noqa: B018
+        unshared.append(copy)
+    print(f"Shared attributes: {_deep_getsizeof(states)} bytes")
+    print(f"Unshared attributes: {_deep_getsizeof(unshared)} bytes")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -355,3 +837,371 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def time_change_wakeups(hass):
+    """Track time patterns for 10k synthetic entities.
+
+    6000 listen every minute, 2000 every 5 minutes and 2000
+    every 10 seconds, similar to template and polling helpers.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import (
+        _TRACK_UTC_TIME_CHANGE_DATA,
+        async_track_utc_time_change,
+    )
+
+    count = 0
+
+    @core.callback
+    def listener(_):
+        nonlocal count
+        count += 1
+
+    patterns = (
+        [{"second": 0}] * 6000
+        + [{"minute": "/5", "second": 0}] * 2000
+        + [{"second": "/10"}] * 2000
+    )
+    start = timer()
+    unsubs = [async_track_utc_time_change(hass, listener, **kw) for kw in patterns]
+    tracks = hass.data[_TRACK_UTC_TIME_CHANGE_DATA]
+    for track in list(tracks.values()):
+        track._pattern_time_change_listener(dt_util.utcnow())  # noqa: SLF001
+    await hass.async_block_till_done()
+    runtime = timer() - start
+
+    def wakeups_per_minute(key):
+        seconds, minutes, hours, _ = key
+        return len(seconds) * len(minutes) / 60 * len(hours) / 24
+
+    listener_wakeups = sum(
+        wakeups_per_minute(key) * len(track.jobs) for key, track in tracks.items()
+    )
+    timer_wakeups = sum(wakeups_per_minute(key) for key in tracks)
+    active_timers = sum(not handle.cancelled() for handle in hass.loop._scheduled)  # noqa: SLF001
+    print(
+        f"{len(unsubs)} listeners, {active_timers} timers,"
+        f" {timer_wakeups:.1f} loop wakeups per minute"
+        f" ({listener_wakeups:.0f} with a timer per listener),"
+        f" {count} listener calls"
+    )
+    for unsub in unsubs:
+        unsub()
+    return runtime
+
+
+@benchmark
+async def disabled_entities_add(hass):
+    """Add a platform with 5k entities whose registry entries are disabled.
+
+    The entities are added with update_before_add, as many polling
+    integrations do, once skipping the update based on their registry
+    entry and once updating them before the add is aborted.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    class DisabledEntity(Entity):
+        _attr_entity_registry_enabled_default = False
+        _attr_should_poll = False
+
+        def __init__(self, idx):
+            self._attr_name = f"Benchmark {idx}"
+            self._attr_unique_id = f"benchmark-{idx}"
+            self._attr_extra_state_attributes = {"payload": "x" * 1024}
+
+        async def async_update(self):
+            await asyncio.sleep(0)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+
+        async def add_entities(skip):
+            platform = EntityPlatform(
+                hass=hass,
+                logger=logging.getLogger(__name__),
+                domain="sensor",
+                platform_name="benchmark",
+                platform=None,
+                scan_interval=timedelta(seconds=30),
+                entity_namespace=None,
+            )
+            if not skip:
+                platform._async_registry_entry_disabled = lambda *args: False  # noqa: SLF001
+            gc.collect()
+            tracemalloc.start()
+            start = timer()
+            await platform.async_add_entities(
+                (DisabledEntity(idx) for idx in range(5000)),
+                update_before_add=True,
+            )
+            runtime = timer() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"skip disabled={skip}: {runtime:.3f}s,"
+                f" {peak / 1024 / 1024:.1f} MiB peak allocated"
+            )
+            return runtime
+
+        # Create the disabled registry entries
+        await add_entities(False)
+        await add_entities(False)
+        return await add_entities(True)
+
+
+@benchmark
+async def recorder_purge_cycles(hass):
+    """Purge 400k states in purge cycles and report the longest cycle.
+
+    The recorder cannot commit new states while a purge cycle runs, so
+    the longest cycle is the worst commit latency during the purge. The
+    purge is run once limited only by the number of batches per cycle
+    and once also limited by the time budget of a cycle.
+
+    The database defaults to an in-memory SQLite database, a MariaDB or
+    PostgreSQL server can be used by setting BENCHMARK_RECORDER_DB_URL.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import insert
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.purge import (
+        DEFAULT_PURGE_CYCLE_TIME_BUDGET,
+        DEFAULT_STATES_BATCHES_PER_PURGE,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.queries import (
+        delete_states_rows,
+        disconnect_states_rows,
+        find_states_to_purge,
+    )
+
+    rows_to_purge = 4 * 10**5
+    max_bind_vars = 4000
+    engine = _recorder_benchmark_engine()
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        states_meta = StatesMeta(entity_id="sensor.power")
+        session.add(states_meta)
+        session.commit()
+        metadata_id = states_meta.metadata_id
+
+    def _fill() -> None:
+        with Session(engine) as session:
+            session.execute(
+                insert(States),
+                [
+                    {
+                        "state": str(idx),
+                        "last_updated_ts": float(idx),
+                        "metadata_id": metadata_id,
+                    }
+                    for idx in range(rows_to_purge)
+                ],
+            )
+            session.commit()
+
+    def _purge(time_budget: float) -> tuple[float, float, int]:
+        purge_before = float(rows_to_purge)
+        cycles = 0
+        longest = 0.0
+        start = timer()
+        while True:
+            cycles += 1
+            cycle_start = timer()
+            deadline = time.monotonic() + time_budget
+            with Session(engine) as session:
+                for _ in range(DEFAULT_STATES_BATCHES_PER_PURGE):
+                    state_ids = [
+                        state_id
+                        for state_id, _ in session.execute(
+                            find_states_to_purge(purge_before, max_bind_vars)
+                        )
+                    ]
+                    if not state_ids:
+                        break
+                    session.execute(disconnect_states_rows(state_ids))
+                    session.execute(delete_states_rows(state_ids))
+                    if time.monotonic() > deadline:
+                        break
+                session.commit()
+            longest = max(longest, timer() - cycle_start)
+            if not state_ids:
+                return timer() - start, longest, cycles
+
+    runtime = 0.0
+    for time_budget in (float("inf"), DEFAULT_PURGE_CYCLE_TIME_BUDGET):
+        await hass.async_add_executor_job(_fill)
+        runtime, longest, cycles = await hass.async_add_executor_job(
+            _purge, time_budget
+        )
+        print(
+            f"{engine.dialect.name} time budget {time_budget}s: purged in"
+            f" {runtime:.2f}s with {cycles} cycles,"
+            f" longest cycle {longest * 1000:.0f}ms"
+        )
+    engine.dispose()
+    return runtime
+
+
+@benchmark
+async def logbook_entity_week(hass):
+    """Query a week of logbook entries for one of 50 entities.
+
+    Every 5 minutes all 50 entities change state in the same context,
+    as they would when an automation or scene sets them together.
+    The states have no old state so only the rows that link the
+    contexts of the entity are returned.
+
+    The database defaults to an in-memory SQLite database, a MariaDB or
+    PostgreSQL server can be used by setting BENCHMARK_RECORDER_DB_URL.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import insert
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.logbook.queries import statement_for_request
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.util import execute_stmt_lambda_element
+
+    end = dt_util.utcnow()
+    start = end - timedelta(days=7)
+    engine = _recorder_benchmark_engine()
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        states_meta = [
+            StatesMeta(entity_id=f"light.benchmark_{idx}") for idx in range(50)
+        ]
+        session.add_all(states_meta)
+        session.commit()
+        metadata_ids = [meta.metadata_id for meta in states_meta]
+        start_ts = start.timestamp()
+        session.execute(
+            insert(States),
+            [
+                {
+                    "state": "on" if tick % 2 else "off",
+                    "last_updated_ts": start_ts + tick * 300 + 1,
+                    "last_changed_ts": start_ts + tick * 300 + 1,
+                    "metadata_id": metadata_id,
+                    "context_id_bin": tick.to_bytes(16, "big"),
+                }
+                for tick in range(7 * 288)
+                for metadata_id in metadata_ids
+            ],
+        )
+        session.commit()
+
+    def _query() -> tuple[float, int]:
+        with Session(engine) as session:
+            query_start = timer()
+            rows = list(
+                execute_stmt_lambda_element(
+                    session,
+                    statement_for_request(
+                        start,
+                        end,
+                        (),
+                        ["light.benchmark_0"],
+                        metadata_ids[:1],
+                    ),
+                    orm_rows=False,
+                )
+            )
+            return timer() - query_start, len(rows)
+
+    runtime, rows = await hass.async_add_executor_job(_query)
+    engine.dispose()
+    print(f"{engine.dialect.name}: {rows} rows")
+    return runtime
+
+
+@benchmark
+async def service_target_resolution(hass):
+    """Resolve 1k service call area and label targets on 5k entities.
+
+    The targets are resolved once with the resolved target cache
+    cleared before every call and once with the cache in use.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        service,
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await asyncio.gather(
+            ar.async_load(hass),
+            dr.async_load(hass),
+            er.async_load(hass),
+            fr.async_load(hass),
+            lr.async_load(hass),
+        )
+        area_reg = ar.async_get(hass)
+        label_reg = lr.async_get(hass)
+        ent_reg = er.async_get(hass)
+        area_ids = [area_reg.async_create(f"Area {idx}").id for idx in range(50)]
+        label_ids = [label_reg.async_create(f"Label {idx}").id for idx in range(20)]
+        for idx in range(5000):
+            entry = ent_reg.async_get_or_create("light", "benchmark", f"light-{idx}")
+            ent_reg.async_update_entity(
+                entry.entity_id,
+                area_id=area_ids[idx % len(area_ids)],
+                labels={label_ids[idx % len(label_ids)]},
+            )
+        await hass.async_block_till_done()
+
+        calls = [
+            core.ServiceCall("light", "turn_off", {"area_id": area_ids[idx % 10]})
+            if idx % 2
+            else core.ServiceCall("light", "turn_off", {"label_id": label_ids[idx % 5]})
+            for idx in range(1000)
+        ]
+
+        def resolve(cached):
+            resolved_cache = hass.data.get(service.TARGET_RESOLUTION_CACHE)
+            start = timer()
+            for call in calls:
+                if not cached and resolved_cache is not None:
+                    resolved_cache.clear()
+                service.async_extract_referenced_entity_ids(hass, call)
+                resolved_cache = hass.data[service.TARGET_RESOLUTION_CACHE]
+            runtime = timer() - start
+            print(f"cached={cached}: {runtime:.3f}s")
+            return runtime
+
+        resolve(False)
+        return resolve(True)
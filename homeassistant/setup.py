@@ -804,6 +804,20 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_import_timings(hass: core.HomeAssistant) -> dict[str, float]:
+    """Return the time it took to import each integration."""
+    timings: dict[str, float] = {}
+    for domain, int_or_fut in hass.data[loader.DATA_INTEGRATIONS].items():
+        # Integration is never subclassed, so we can check for type
+        if (
+            type(int_or_fut) is loader.Integration
+            and (seconds := int_or_fut.import_seconds) is not None
+        ):
+            timings[domain] = seconds
+    return timings
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -88,6 +88,19 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: (val / from_ratio) * to_ratio
 
+    @classmethod
+    def convert_many(
+        cls, values: Iterable[float], from_unit: str | None, to_unit: str | None
+    ) -> list[float]:
+        """Convert many values from one unit of measurement to another.
+
+        The ratio is looked up once for all values.
+        """
+        if from_unit == to_unit:
+            return list(values)
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return [(val / from_ratio) * to_ratio for val in values]
+
     @classmethod
     def _get_from_to_ratio(
         cls, from_unit: str | None, to_unit: str | None
@@ -379,6 +392,14 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    def convert_many(
+        cls, values: Iterable[float], from_unit: str | None, to_unit: str | None
+    ) -> list[float]:
+        """Convert many speeds from one unit to another."""
+        convert = cls.converter_factory(from_unit, to_unit)
+        return [convert(val) for val in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -459,6 +480,14 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    def convert_many(
+        cls, values: Iterable[float], from_unit: str | None, to_unit: str | None
+    ) -> list[float]:
+        """Convert many temperatures from one unit to another."""
+        convert = cls.converter_factory(from_unit, to_unit)
+        return [convert(val) for val in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
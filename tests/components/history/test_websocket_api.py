@@ -1,7 +1,11 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+import base64
+from collections.abc import Generator
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -10,6 +14,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -172,6 +177,114 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the same states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on", "off"):
+        hass.states.async_set("sensor.one", state, attributes={"any": "attr"})
+        hass.states.async_set("sensor.two", state, attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "include_start_time_state": True,
+        "significant_changes_only": False,
+        "no_attributes": True,
+        "minimal_response": True,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == 4
+
+    await client.send_json({"id": 2, "chunk_size": 3, **request})
+    chunks = []
+    while (response := await client.receive_json())["type"] == "event":
+        assert response["id"] == 2
+        chunks.append(response["event"]["states"])
+    assert response["success"]
+    assert response["id"] == 2
+    assert response["result"] == {}
+    assert len(chunks) == 3
+
+    merged: dict[str, list] = {}
+    for chunk in chunks:
+        assert sum(len(states) for states in chunk.values()) <= 3
+        for entity_id, states in chunk.items():
+            merged.setdefault(entity_id, []).extend(states)
+    assert merged == expected
+
+
+async def test_history_during_period_chunked_stops_on_disconnect(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period stops reading chunks when the client goes away."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+
+    disconnected = threading.Event()
+    closed = threading.Event()
+    chunks_read = 0
+
+    def _iter_chunks(*args: Any) -> Generator[dict[str, list[dict[str, Any]]]]:
+        nonlocal chunks_read
+        try:
+            for idx in range(5):
+                chunks_read += 1
+                yield {"sensor.test": [{"s": str(idx), "lu": now.timestamp()}]}
+                disconnected.wait(5)
+        finally:
+            closed.set()
+
+    handle_close = ActiveConnection.async_handle_close
+
+    def _handle_close(self: ActiveConnection) -> None:
+        handle_close(self)
+        disconnected.set()
+
+    client = await hass_ws_client()
+    with (
+        patch.object(
+            websocket_api.history,
+            "iter_significant_states_chunks",
+            side_effect=_iter_chunks,
+        ),
+        patch.object(ActiveConnection, "async_handle_close", _handle_close),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert response["event"]["states"] == {
+            "sensor.test": [{"s": "0", "lu": now.timestamp()}]
+        }
+        await client.close()
+        assert await hass.async_add_executor_job(closed.wait, 5)
+
+    # The chunk read while the connection closed is dropped
+    # and the rest of the range is never read
+    assert chunks_read == 2
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -453,6 +566,96 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_page(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test paging through history with cursors."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(5):
+        hass.states.async_set("sensor.test", str(value), attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages: list[list[str]] = []
+    cursor: str | None = None
+    for msg_id in range(1, 5):
+        msg = {
+            "id": msg_id,
+            "type": "history/history_page",
+            "start_time": now.isoformat(),
+            "entity_id": "sensor.test",
+            "limit": 2,
+            "no_attributes": True,
+        }
+        if cursor:
+            msg["cursor"] = cursor
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append([state["s"] for state in response["result"]["states"]])
+        assert all("a" not in state for state in response["result"]["states"])
+        if not (cursor := response["result"]["next_cursor"]):
+            break
+
+    assert pages == [["3", "4"], ["1", "2"], ["0"]]
+
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "history/history_page",
+            "start_time": now.isoformat(),
+            "end_time": now.isoformat(),
+            "entity_id": "sensor.test",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"states": [], "next_cursor": None}
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "$",
+        base64.urlsafe_b64encode(b"{}").decode(),
+        base64.urlsafe_b64encode(b'"ab"').decode(),
+        base64.urlsafe_b64encode(b"[1.5]").decode(),
+        base64.urlsafe_b64encode(b"[1.5, 2, 3]").decode(),
+        base64.urlsafe_b64encode(b'[1.5, "2"]').decode(),
+        base64.urlsafe_b64encode(b"[1.5, 2.5]").decode(),
+        base64.urlsafe_b64encode(b"[true, 2]").decode(),
+        base64.urlsafe_b64encode(b"[null, 2]").decode(),
+    ],
+)
+async def test_history_page_bad_cursor(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    cursor: str,
+) -> None:
+    """Test history page bad cursor."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_page",
+            "start_time": now.isoformat(),
+            "entity_id": "sensor.test",
+            "cursor": cursor,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
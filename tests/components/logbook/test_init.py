@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -15,6 +15,7 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.logbook import processor
 from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
@@ -47,6 +48,7 @@ from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import MockRow, mock_humanify
 
@@ -2892,6 +2894,82 @@ async def test_logbook_select_entities_context_id(
     assert json_dict[3]["context_user_id"] == "9400facee45711eaa9308bfd3d19e474"
 
 
+async def test_logbook_one_context_row_per_context(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test only the first event and state of a shared context are selected."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    hass.states.async_set(
+        "automation.alarm",
+        STATE_ON,
+        {ATTR_FRIENDLY_NAME: "Alarm Automation"},
+        context=context,
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    # The context is shared by many other entities
+    for idx in range(5):
+        hass.states.async_set(f"light.shared_{idx}", STATE_OFF)
+        hass.states.async_set(f"light.shared_{idx}", STATE_ON, context=context)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    rows = []
+    execute_stmt_lambda_element = processor.execute_stmt_lambda_element
+
+    def _capture_rows(*args, **kwargs):
+        result = list(execute_stmt_lambda_element(*args, **kwargs))
+        rows.extend(result)
+        return result
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day, tzinfo=dt_util.UTC)
+    with patch.object(
+        processor, "execute_stmt_lambda_element", side_effect=_capture_rows
+    ):
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}?entity=light.shared_4"
+        )
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+
+    # One event and one state row for the context instead of one
+    # row for every event and state that shares the context
+    context_rows = collections.Counter(
+        (row.context_id_bin, row.entity_id is None) for row in rows if row.context_only
+    )
+    assert set(context_rows.values()) == {1}
+    assert (ulid_to_bytes(context.id), True) in context_rows
+    assert (ulid_to_bytes(context.id), False) in context_rows
+
+    assert len(json_dict) == 1
+    assert json_dict[0]["entity_id"] == "light.shared_4"
+    assert json_dict[0]["context_event_type"] == "automation_triggered"
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    assert json_dict[0]["context_entity_id_name"] == "Alarm Automation"
+    assert json_dict[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+
 async def test_get_events_with_context_state(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1,8 +1,10 @@
 """The tests for the logbook component."""
 
 import asyncio
+import base64
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -11,7 +13,7 @@ import pytest
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook import processor, websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -427,6 +429,228 @@ async def test_get_events_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_get_events_page(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test paging through logbook events with cursors."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    # The first state has no previous state so it is not a logbook entry
+    with freeze_time(now - timedelta(hours=5)):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+    offsets = [timedelta(hours=hours) for hours in (4, 3, 2, 1, 0.5)]
+    for offset, state in zip(offsets, (STATE_ON, STATE_OFF) * 3, strict=False):
+        with freeze_time(now - offset):
+            hass.states.async_set("light.kitchen", state)
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+    expected = [(now - offset).timestamp() for offset in offsets]
+
+    client = await hass_ws_client()
+    pages: list[list[float]] = []
+    cursor: str | None = None
+    for msg_id in range(1, 5):
+        msg = {
+            "id": msg_id,
+            "type": "logbook/get_events_page",
+            "start_time": (now - timedelta(days=1)).isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 2,
+        }
+        if cursor:
+            msg["cursor"] = cursor
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append([entry["when"] for entry in response["result"]["events"]])
+        if not (cursor := response["result"]["next_cursor"]):
+            break
+
+    assert pages == [expected[3:], expected[1:3], expected[:1]]
+
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "logbook/get_events_page",
+            "start_time": (now - timedelta(days=1)).isoformat(),
+            "cursor": "$",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
+async def _async_get_all_events_pages(
+    client, start_time: str, limit: int, **request: Any
+) -> list[list[dict[str, Any]]]:
+    """Fetch all the pages of events with cursors."""
+    pages: list[list[dict[str, Any]]] = []
+    msg: dict[str, Any] = {
+        "type": "logbook/get_events_page",
+        "start_time": start_time,
+        "limit": limit,
+        **request,
+    }
+    for msg_id in range(1, 50):
+        await client.send_json({"id": msg_id, **msg})
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(response["result"]["events"])
+        if not (cursor := response["result"]["next_cursor"]):
+            return pages
+        msg["cursor"] = cursor
+    raise AssertionError("Too many pages")
+
+
+async def test_get_events_page_same_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test events at the same time are on exactly one page."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    entity_ids = [f"light.same_time_{idx}" for idx in range(7)]
+    with freeze_time(now - timedelta(hours=2)):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, STATE_OFF)
+        await hass.async_block_till_done()
+    with freeze_time(now - timedelta(hours=1)):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    queries = 0
+    execute_stmt_lambda_element = processor.execute_stmt_lambda_element
+
+    def _execute_with_ties_in_any_order(*args: Any, **kwargs: Any) -> list[Any]:
+        """Return the rows of the same time in a different order each query."""
+        nonlocal queries
+        queries += 1
+        direction = 1 if queries % 2 else -1
+        return sorted(
+            execute_stmt_lambda_element(*args, **kwargs),
+            key=lambda row: (row.time_fired_ts, direction * row.row_id),
+        )
+
+    client = await hass_ws_client()
+    with patch.object(
+        processor,
+        "execute_stmt_lambda_element",
+        side_effect=_execute_with_ties_in_any_order,
+    ):
+        pages = await _async_get_all_events_pages(
+            client,
+            (now - timedelta(days=1)).isoformat(),
+            2,
+            entity_ids=entity_ids,
+        )
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    paged_entity_ids = [entry["entity_id"] for page in pages for entry in page]
+    assert sorted(paged_entity_ids) == entity_ids
+
+
+async def test_get_events_page_context_in_older_window(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an entry is augmented with a context that started in an older window."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    with freeze_time(now - timedelta(hours=3)):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+            context=context,
+        )
+        await hass.async_block_till_done()
+    # The first page window only covers the last minute
+    with freeze_time(now - timedelta(seconds=30)):
+        hass.states.async_set("light.kitchen", STATE_ON, context=context)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages = await _async_get_all_events_pages(
+        client, (now - timedelta(hours=4)).isoformat(), 100
+    )
+    assert len(pages) == 1
+    light_entries = [
+        entry for entry in pages[0] if entry.get("entity_id") == "light.kitchen"
+    ]
+    assert len(light_entries) == 1
+    assert light_entries[0]["context_event_type"] == "automation_triggered"
+    assert light_entries[0]["context_entity_id"] == "automation.alarm"
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "$",
+        base64.urlsafe_b64encode(b"{}").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, 1]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, 1, 60, 4]").decode(),
+        base64.urlsafe_b64encode(b'[1700000000.5, 1, "1", 60]').decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, 1.5, 60]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, true, 1, 60]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 2, 1, 60]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, -1, 60]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, 1, 0]").decode(),
+        base64.urlsafe_b64encode(b"[1700000000.5, 1, 1, 1e300]").decode(),
+        base64.urlsafe_b64encode(b"[1e300, 1, 1, 60]").decode(),
+    ],
+)
+async def test_get_events_page_bad_cursor(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    cursor: str,
+) -> None:
+    """Test get_events_page rejects malformed cursors."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events_page",
+            "start_time": (now - timedelta(days=1)).isoformat(),
+            "cursor": cursor,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
 async def test_get_events_invalid_filters(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1418,6 +1418,34 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_unsubscribe_overlapping_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test removing a wildcard subscription keeps overlapping ones matching."""
+    await mqtt_mock_entry()
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+/+", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    unsub_level()
+    unsub_subtree()
+    recorded_calls.clear()
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/bier", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 1
+    assert recorded_calls[0].topic == "test-topic/bier/on"
+    assert recorded_calls[0].subscribed_topic == "test-topic/+/+"
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -22,6 +22,7 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history.hot_cache import HistoryHotCache
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -658,6 +659,57 @@ async def test_get_significant_states_without_initial(
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize(
+    "entity_ids",
+    [
+        ["media_player.test"],
+        ["thermostat.test3"],
+        ["media_player.test", "media_player.test3", "thermostat.test"],
+    ],
+)
+async def test_get_significant_states_from_hot_cache(
+    hass: HomeAssistant,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    entity_ids: list[str],
+) -> None:
+    """Test the history hot cache returns the same states as the database."""
+    instance = get_instance(hass)
+    hot_cache = instance.history_hot_cache = HistoryHotCache(1000)
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    one_and_half = zero + timedelta(seconds=1.5)
+    kwargs = {
+        "entity_ids": entity_ids,
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": True,
+        "compressed_state_format": True,
+    }
+    for start_time, end_time in ((one_and_half, four), (one_and_half, None)):
+        with patch.object(
+            history.modern,
+            "execute_stmt_lambda_element",
+            side_effect=AssertionError("Hot cache was not used"),
+        ):
+            cached = history.get_significant_states(
+                hass, start_time, end_time, **kwargs
+            )
+        instance.history_hot_cache = None
+        assert cached == history.get_significant_states(
+            hass, start_time, end_time, **kwargs
+        )
+        instance.history_hot_cache = hot_cache
+
+    # The cache does not cover the start time so the database is used
+    hist = history.get_significant_states(hass, zero, four, **kwargs)
+    instance.history_hot_cache = None
+    assert hist == history.get_significant_states(hass, zero, four, **kwargs)
+
+
 async def test_get_significant_states_entity_id(
     hass: HomeAssistant,
 ) -> None:
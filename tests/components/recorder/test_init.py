@@ -1017,6 +1017,8 @@ async def test_defaults_set(hass: HomeAssistant) -> None:
     assert recorder_config["auto_purge"]
     assert recorder_config["auto_repack"]
     assert recorder_config["purge_keep_days"] == 10
+    assert recorder_config["bulk_insert"] is False
+    assert recorder_config["history_cache_size"] == 0
 
 
 async def run_tasks_at_time(hass: HomeAssistant, test_time: datetime) -> None:
@@ -1471,6 +1473,82 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_sets_old_state_with_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test saving with bulk inserts links old states and attributes."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": True})
+    assert instance._bulk_insert_states is True
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s5"].entity_id == "test.one"
+        assert states_by_state[None].entity_id == "test.two"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+
+        assert states_by_state["s1"].shared_attrs == '{"attr":1}'
+        assert states_by_state["s3"].shared_attrs == '{"attr":2}'
+        assert states_by_state["s5"].shared_attrs == '{"attr":1}'
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+async def test_saving_old_state_that_cannot_be_serialized(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert: bool,
+) -> None:
+    """Test a state that cannot be serialized is still linked as old state."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": bulk_insert})
+    assert instance._bulk_insert_states is bulk_insert
+
+    hass.states.async_set("test.one", "s1", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.one", "s2", {})
+    hass.states.async_set("test.one", "s3", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1696,7 +1774,15 @@ async def test_database_corruption_while_running(
 
     recorder_helper.async_initialize_recorder(hass)
     assert await async_setup_component(
-        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                CONF_DB_URL: dburl,
+                CONF_COMMIT_INTERVAL: 0,
+                "history_cache_size": 100,
+            }
+        },
     )
     await hass.async_block_till_done()
     caplog.clear()
@@ -1710,6 +1796,7 @@ async def test_database_corruption_while_running(
     sqlite3_exception.__cause__ = sqlite3.DatabaseError()
 
     await async_wait_recording_done(hass)
+    assert len(instance.history_hot_cache) == 1
     with patch.object(
         get_instance(hass).event_session,
         "close",
@@ -1749,6 +1836,8 @@ async def test_database_corruption_while_running(
     state = await instance.async_add_executor_job(_get_last_state)
     assert state.entity_id == "test.two"
     assert state.state == "on"
+    # The states cached from the corrupt database were dropped
+    assert len(instance.history_hot_cache) == 1
 
     new_start_time = instance.recorder_runs_manager.recording_start
     assert original_start_time < new_start_time
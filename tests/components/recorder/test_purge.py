@@ -3,6 +3,7 @@
 from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
+import logging
 import sqlite3
 from unittest.mock import patch
 
@@ -105,6 +106,74 @@ async def test_purge_big_database(
         assert state_attributes.count() == 1
 
 
+async def test_purge_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge cycle stops selecting batches once its time budget is used."""
+
+    instance = await async_setup_recorder_instance(hass)
+
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(instance, "max_bind_vars", 12),
+        patch.object(instance.database_engine, "max_bind_vars", 12),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        assert states.count() == 72
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False, time_budget=0)
+        assert not finished
+        assert states.count() == 60
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 24
+
+
+async def test_purge_skips_attributes_referenced_by_newer_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test attributes shared with newer states are not looked up when purging."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+    shared_attributes = {"shared": True}
+
+    with freeze_time() as freezer:
+        freezer.move_to(utcnow - timedelta(days=5))
+        hass.states.async_set("test.shared", "old", shared_attributes)
+        hass.states.async_set("test.orphan", "old", {"orphan": True})
+        await async_wait_recording_done(hass)
+        freezer.move_to(utcnow)
+        hass.states.async_set("test.shared", "new", shared_attributes)
+        hass.states.async_set("test.orphan", "new", {"orphan": False})
+        await async_wait_recording_done(hass)
+
+    caplog.set_level(logging.DEBUG, "homeassistant.components.recorder.purge")
+    with session_scope(hass=hass) as session:
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 3
+
+        finished = purge_old_data(instance, utcnow - timedelta(days=4), repack=False)
+        assert finished
+        assert session.query(States).count() == 2
+        remaining_attributes = [
+            json.loads(attributes.shared_attrs) for attributes in state_attributes
+        ]
+        assert len(remaining_attributes) == 2
+        assert shared_attributes in remaining_attributes
+        assert {"orphan": False} in remaining_attributes
+
+    assert "Skipped 1 attributes ids referenced by newer states" in caplog.text
+
+
 async def test_purge_old_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -8,7 +8,7 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -374,6 +374,91 @@ async def test_compile_periodic_statistics_exception(
     }
 
 
+@pytest.mark.freeze_time("2022-10-01 00:30:00+00:00")
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test hourly statistics are summarized from the accumulated short term rows."""
+    await async_setup_component(hass, "sensor", {})
+
+    def sensor_stats(entity_id, start, value):
+        return {
+            "meta": {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "statistic_id": entity_id,
+                "unit_of_measurement": "dogs",
+            },
+            "stat": {
+                "start": start,
+                "mean": value,
+                "min": None if value is None else value - 1,
+                "max": None if value is None else value + 1,
+                "last_reset": None,
+                "state": value,
+                "sum": start.minute * 0.1,
+            },
+        }
+
+    def get_fake_stats(_hass, session, start, _end):
+        return statistics.PlatformCompiledStatistics(
+            [
+                sensor_stats("sensor.test1", start, start.minute / 7),
+                sensor_stats("sensor.test2", start, None),
+            ],
+            get_metadata(_hass, statistic_ids={"sensor.test1", "sensor.test2"}),
+        )
+
+    hour_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hour_start -= timedelta(hours=1)
+    with (
+        patch(
+            "homeassistant.components.sensor.recorder.compile_statistics",
+            side_effect=get_fake_stats,
+        ),
+        patch.object(
+            statistics,
+            "_compile_hourly_statistics_summary",
+            wraps=statistics._compile_hourly_statistics_summary,
+        ) as compile_summary_mock,
+    ):
+        for minute in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=minute))
+        await async_wait_recording_done(hass)
+
+    assert compile_summary_mock.call_count == 0
+
+    def _get_hourly_and_db_summary():
+        with session_scope(hass=hass, read_only=True) as session:
+            hourly = {
+                row.metadata_id: {
+                    "start_ts": row.start_ts,
+                    "mean": row.mean,
+                    "min": row.min,
+                    "max": row.max,
+                    "last_reset_ts": row.last_reset_ts,
+                    "state": row.state,
+                    "sum": row.sum,
+                }
+                for row in session.query(Statistics)
+            }
+            db_summary = statistics._compile_hourly_statistics_summary(
+                session,
+                hour_start.timestamp(),
+                (hour_start + timedelta(hours=1)).timestamp(),
+            )
+            return hourly, db_summary
+
+    hourly, db_summary = await recorder.get_instance(hass).async_add_executor_job(
+        _get_hourly_and_db_summary
+    )
+    assert len(hourly) == 2
+    assert hourly.keys() == db_summary.keys()
+    for metadata_id, summary in db_summary.items():
+        assert hourly[metadata_id] == pytest.approx(summary)
+
+
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
 ) -> None:
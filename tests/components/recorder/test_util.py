@@ -970,6 +970,17 @@ async def test_execute_stmt_lambda_element(
         assert rows[0].state == new_state.state
         assert rows[0].metadata_id == metadata_id
 
+        # Time window < 2 days, we still stream when asked to
+        with patch.object(session, "execute", wraps=session.execute) as execute_mock:
+            rows = util.execute_stmt_lambda_element(
+                session, stmt, now, tomorrow, stream_results=True
+            )
+        assert isinstance(rows, ChunkedIteratorResult)
+        execution_options = execute_mock.call_args[0][0].get_execution_options()
+        assert execution_options["stream_results"] is True
+        row = next(rows)
+        assert row.state == new_state.state
+
         with patch.object(session, "execute", MockExecutor):
             rows = util.execute_stmt_lambda_element(session, stmt, now, tomorrow)
             assert rows == ["mock_row"]
@@ -0,0 +1,45 @@
+"""Test Template diagnostics."""
+
+from homeassistant.components.template.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test diagnostics reports the shared compiled templates."""
+    state_template = "{{ float(states('sensor.one')) + float(states('sensor.two')) }}"
+    for name in ("one", "two"):
+        config_entry = MockConfigEntry(
+            data={},
+            domain=DOMAIN,
+            options={
+                "name": f"My template {name}",
+                "state": state_template,
+                "template_type": "sensor",
+            },
+            title=f"My template {name}",
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.my_template_one") is not None
+    assert hass.states.get("sensor.my_template_two") is not None
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["config_entry"]["options"]["state"] == state_template
+    stats = diagnostics["template_cache"]["default"]
+    assert stats["compile_hits"] >= 1
+    assert stats["bind_hits"] >= 1
+    assert stats["compiled_templates"] >= 1
+    assert stats["bound_templates"] >= 1
+    render_times = diagnostics["render_times"][state_template]
+    assert render_times["count"] >= 2
+    assert sum(render_times["buckets"].values()) == render_times["count"]
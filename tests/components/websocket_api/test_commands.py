@@ -1260,6 +1260,49 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_between_subscriptions(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions share one listener and receive the same diff."""
+    hass.states.async_set("light.permitted", "off")
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for msg_id, entity_ids in (
+        (7, ["light.permitted"]),
+        (8, ["light.permitted"]),
+        (9, None),
+    ):
+        subscribe = {"id": msg_id, "type": "subscribe_entities"}
+        if entity_ids:
+            subscribe["entity_ids"] = entity_ids
+        await websocket_client.send_json(subscribe)
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+    events = [await websocket_client.receive_json() for _ in range(4)]
+    assert [event["id"] for event in events] == [9, 9, 7, 8]
+    assert list(events[0]["event"]["a"]) == ["light.other"]
+    assert list(events[1]["event"]["c"]) == ["light.permitted"]
+    assert events[1]["event"] == events[2]["event"] == events[3]["event"]
+
+    for msg_id in (7, 8, 9):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2492,12 +2535,18 @@ async def test_integration_setup_info(
     hass_admin_user: MockUser,
 ) -> None:
     """Test subscribe/unsubscribe bootstrap_integrations."""
-    with patch(
-        "homeassistant.components.websocket_api.commands.async_get_setup_timings",
-        return_value={
-            "august": 12.5,
-            "isy994": 12.8,
-        },
+    with (
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_setup_timings",
+            return_value={
+                "august": 12.5,
+                "isy994": 12.8,
+            },
+        ),
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_import_timings",
+            return_value={"august": 1.5},
+        ),
     ):
         await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
         msg = await websocket_client.receive_json()
@@ -2506,8 +2555,8 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": None},
     ]
 
 
@@ -6,10 +6,13 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    construct_result_list_message,
+    join_json_members,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -301,3 +304,17 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+@pytest.mark.parametrize(
+    "members", [[], [b"1"], [b"1", b'"two"'], [b"1", b"{}", b"[3]", b"null"]]
+)
+def test_construct_result_list_message(members: list[bytes]) -> None:
+    """Test constructing a result message from JSON list members."""
+    assert json_loads(construct_result_list_message(5, members)) == {
+        "id": 5,
+        "type": "result",
+        "success": True,
+        "result": [json_loads(member) for member in members],
+    }
+    assert join_json_members(b"{", members, b"}") == (b"{" + b",".join(members) + b"}")
@@ -20,6 +20,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -34,6 +35,7 @@ from homeassistant.core import (
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -41,6 +43,8 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -2641,3 +2645,87 @@ async def test_async_write_ha_state_thread_safety_custom_component(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_coalesce_state_writes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test state writes are coalesced when a window is configured."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer", should_poll=False)
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "core", {"state_write_coalesce_window": 10}
+    )
+    await hass.async_block_till_done()
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    # The registry update wrote the state, start outside of its window
+    freezer.tick(11)
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "2"
+
+    freezer.tick(1)
+    ent._attr_state = "3"
+    ent.async_write_ha_state()
+    ent._attr_state = "4"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "2"
+
+    # Writes without changes are not deferred so last_reported is accurate
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "2"
+    assert state.last_reported > state.last_updated
+
+    ent._attr_state = "5"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in state_changes] == ["2"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=9))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "5"
+    assert [event.data["new_state"].state for event in state_changes] == ["2", "5"]
+
+    stats = entity.async_get_coalesced_state_writes(hass)
+    assert stats["suppressed_writes"] == {ent.entity_id: 3}
+    assert stats["total_suppressed_writes"] == 3
+    assert stats["estimated_listener_calls_saved"] >= 3
+
+    # Once the window has passed the next write goes through right away
+    freezer.tick(11)
+    ent._attr_state = "6"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "6"
+
+    # Counters are dropped when the entity is removed
+    await platform.async_remove_entity(ent.entity_id)
+    assert entity.async_get_coalesced_state_writes(hass)["suppressed_writes"] == {}
+
+
+@pytest.mark.parametrize("window", [-1, 0, True, "10", 301])
+async def test_coalesce_state_writes_invalid_window(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+    window: Any,
+) -> None:
+    """Test invalid coalescing windows do not defer state writes."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer", should_poll=False)
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "core", {"state_write_coalesce_window": window}
+    )
+    await hass.async_block_till_done()
+
+    for value in ("2", "3"):
+        freezer.tick(1)
+        ent._attr_state = value
+        ent.async_write_ha_state()
+        assert hass.states.get(ent.entity_id).state == value
@@ -795,6 +795,37 @@ async def test_registry_respect_entity_disabled(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids() == []
 
 
+async def test_registry_disabled_entity_not_updated(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test an entity with a disabled registry entry is not updated before adding."""
+    entry = entity_registry.async_get_or_create(
+        DOMAIN,
+        "test_platform",
+        "1234",
+        disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+        original_name="before",
+    )
+    platform = MockEntityPlatform(hass)
+    disabled = MockEntity(unique_id="1234", name="after")
+    disabled.async_update = AsyncMock()
+    enabled = MockEntity(unique_id="5678")
+    enabled.async_update = AsyncMock()
+
+    await platform.async_add_entities([disabled, enabled], update_before_add=True)
+
+    assert not disabled.async_update.called
+    assert enabled.async_update.called
+    assert disabled.hass is None
+    assert disabled.platform is None
+    assert disabled.entity_id == entry.entity_id
+    assert hass.states.async_entity_ids() == [enabled.entity_id]
+    # The registry entry is still refreshed from the entity
+    entry = entity_registry.async_get(entry.entity_id)
+    assert disabled.registry_entry is entry
+    assert entry.original_name == "after"
+
+
 async def test_unique_id_conflict_has_priority_over_disabled_entity(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import logging
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -20,6 +21,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TRACK_UTC_TIME_CHANGE_DATA,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -2234,6 +2236,32 @@ async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_logs_all_listener_reasons(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the reason a template listens for all states is logged."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.helpers.event")
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template(
+                    "{{ states('sensor.a') }}\n{{ states | count }}",
+                    hass,
+                ),
+                None,
+            )
+        ],
+        ha.callback(lambda event, updates: None),
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["all"] is True
+    assert (
+        "listens for all state changes because: line 2: states is used as a"
+        " collection"
+    ) in caplog.text
+
+
 async def test_track_template_result_errors(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2459,6 +2487,61 @@ async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     info.async_remove()
 
 
+async def test_track_template_slow_render_rate_limit(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a template that is repeatedly slow to render is rate limited."""
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append(updates.pop().result)
+
+    with patch("homeassistant.helpers.event.SLOW_TEMPLATE_RENDER_TIME", 0):
+        info = async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.one') }}", hass), None)],
+            refresh_listener,
+        )
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.one", "1")
+        await hass.async_block_till_done()
+        assert "took longer than" not in caplog.text
+        hass.states.async_set("sensor.one", "2")
+        await hass.async_block_till_done()
+        assert refresh_runs == [1, 2]
+        assert "it will be re-rendered at most once every 10 seconds" in caplog.text
+
+        hass.states.async_set("sensor.one", "3")
+        await hass.async_block_till_done()
+        assert refresh_runs == [1, 2]
+
+        freezer.tick(11)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert refresh_runs == [1, 2, 3]
+
+    # Once the template renders fast again the rate limit is lifted
+    hass.states.async_set("sensor.one", "4")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 2, 3]
+    freezer.tick(11)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 2, 3, 4]
+
+    hass.states.async_set("sensor.one", "5")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, 2, 3, 4, 5]
+
+    info.async_remove()
+
+
 async def test_track_template_rate_limit_super(hass: HomeAssistant) -> None:
     """Test template rate limit with super template."""
     template_availability = Template(
@@ -3963,6 +4046,53 @@ async def test_periodic_task_hour(
     assert len(specific_runs) == 3
 
 
+async def test_periodic_task_shared_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test periodic tasks with the same pattern share one timer."""
+    runs_one = []
+    runs_two = []
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 21, 59, 55, tzinfo=dt_util.UTC))
+
+    unsub_one = async_track_utc_time_change(
+        hass, callback(lambda x: runs_one.append(x)), minute=0, second=0
+    )
+    unsub_two = async_track_utc_time_change(
+        hass, callback(lambda x: runs_two.append(x)), minute=0, second=0
+    )
+    tracks = hass.data[_TRACK_UTC_TIME_CHANGE_DATA]
+    assert len(tracks) == 1
+    track = next(iter(tracks.values()))
+    assert len(track.jobs) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 22, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_one) == 1
+    assert len(runs_two) == 1
+
+    unsub_one()
+    unsub_one()
+    assert len(track.jobs) == 1
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 23, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_one) == 1
+    assert len(runs_two) == 2
+
+    unsub_two()
+    assert not tracks
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 25, 0, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_two) == 2
+
+
 async def test_periodic_task_wrong_input(hass: HomeAssistant) -> None:
     """Test periodic tasks with wrong input."""
     specific_runs = []
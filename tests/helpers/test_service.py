@@ -116,7 +116,7 @@ def floor_area_mock(hass: HomeAssistant) -> None:
         id="test-area",
         name="Test area",
         aliases={},
-        normalized_name="test-area",
+        normalized_name="testarea",
         floor_id="test-floor",
         icon=None,
         picture=None,
@@ -125,7 +125,7 @@ def floor_area_mock(hass: HomeAssistant) -> None:
         id="area-a",
         name="Area A",
         aliases={},
-        normalized_name="area-a",
+        normalized_name="areaa",
         floor_id="floor-a",
         icon=None,
         picture=None,
@@ -783,6 +783,45 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_cached_until_registry_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test resolved targets are cached until a registry changes them."""
+    ent_reg = er.async_get(hass)
+    call = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    resolved_cache = hass.data[service.TARGET_RESOLUTION_CACHE]
+    assert len(resolved_cache) == 1
+
+    # Changes which do not change any target keep the cache
+    ent_reg.async_update_entity("light.in_area", name="Renamed")
+    await hass.async_block_till_done()
+    assert len(resolved_cache) == 1
+
+    ent_reg.async_update_entity("light.in_area", hidden_by=er.RegistryEntryHider.USER)
+    await hass.async_block_till_done()
+    assert len(resolved_cache) == 0
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.assigned_to_area",
+    }
+
+    ent_reg.async_update_entity("light.no_area", area_id="test-area")
+    await hass.async_block_till_done()
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.assigned_to_area",
+        "light.no_area",
+    }
+
+    ar.async_get(hass).async_update("test-area", floor_id="floor-a")
+    await hass.async_block_till_done()
+    assert len(resolved_cache) == 0
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
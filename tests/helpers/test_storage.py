@@ -664,6 +664,80 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_saving_with_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and compacted on final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+
+        def _read_json(path: str) -> Any:
+            with open(path, encoding="utf8") as fdesc:
+                return json.loads(fdesc.read())
+
+        def _append_partial_record(path: str) -> None:
+            with open(path, "a", encoding="utf8") as fdesc:
+                fdesc.write('{"replace": {"other"')
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_writes=True)
+        snapshot = {"items": [{"id": 1}, {"id": 2}, {"id": 3}], "name": "a"}
+        await store.async_save(snapshot)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        data = {"items": [{"id": 1}, {"id": 4}], "other": True}
+        await store.async_save(data)
+        stored = await hass.async_add_executor_job(_read_json, store.path)
+        assert stored["data"] == snapshot
+        assert await hass.async_add_executor_job(_read_json, store.journal_path) == {
+            "generation": stored["journal_generation"],
+            "replace": {"other": True},
+            "patch": {"items": [2, {"1": {"id": 4}}]},
+            "delete": ["name"],
+        }
+
+        # An unclean shutdown can leave a partial record behind
+        await hass.async_add_executor_job(_append_partial_record, store.journal_path)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_writes=True)
+        assert await store2.async_load() == data
+
+        data["items"].append({"id": 5})
+        store2.async_delay_save(lambda: data, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(
+            os.path.exists, store2.journal_path
+        )
+        stored = await hass.async_add_executor_job(_read_json, store2.path)
+        assert stored["data"] == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_left_behind_by_crash_is_not_replayed(
+    tmpdir: py.path.local,
+) -> None:
+    """Test a journal that was not removed after a snapshot is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_writes=True)
+        await store.async_save({"name": "a"})
+        await store.async_save({"name": "b"})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # Crash after the snapshot is written but before the journal is removed
+        store.async_delay_save(lambda: {"name": "c"}, 10)
+        with patch("homeassistant.helpers.storage.os.unlink"):
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_writes=True)
+        assert await store2.async_load() == {"name": "c"}
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+import gc
 import json
 import logging
 import math
@@ -4453,6 +4454,51 @@ def test_async_render_to_info_with_complex_branching(hass: HomeAssistant) -> Non
     assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
 
 
+def test_analyze_dependencies(hass: HomeAssistant) -> None:
+    """Test static analysis of the states a template depends on."""
+    tmp = template.Template(
+        """
+{% set domain = "vacuum" %}
+{% if states.light.a == "on" %}
+  {{ states.device_tracker | list }}
+{% elif states('light.b') == "on" %}
+  {{ states[domain] | list }} {{ states.sensor[name] }}
+{% elif is_state("switch.c", "on") or "switch.d" is is_state("on") %}
+  {{ expand(["group.e", "light.f"]) }} {{ "sensor.g" | state_attr("unit") }}
+{% endif %}
+""",
+        hass,
+    )
+    deps = tmp.analyze_dependencies()
+    assert deps.entities == {
+        "group.e",
+        "light.a",
+        "light.b",
+        "light.f",
+        "sensor.g",
+        "switch.c",
+        "switch.d",
+    }
+    assert deps.domains == {"device_tracker"}
+    assert deps.all_states_reasons == ()
+    assert tmp.analyze_dependencies() is deps
+
+    tmp = template.Template(
+        "{{ states('sensor.a') }}\n{% for state in states %}{% endfor %}"
+        "\n{{ states | count }}",
+        hass,
+    )
+    deps = tmp.analyze_dependencies()
+    assert deps.entities == {"sensor.a"}
+    assert deps.all_states_reasons == (
+        "line 2: states is used as a collection",
+        "line 3: states is used as a collection",
+    )
+
+    with pytest.raises(TemplateError):
+        template.Template("{{ states('sensor.a') ", hass).analyze_dependencies()
+
+
 async def test_async_render_to_info_with_wildcard_matching_entity_id(
     hass: HomeAssistant,
 ) -> None:
@@ -5115,6 +5161,35 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_identical_templates_share_compiled_template(
+    hass: HomeAssistant,
+) -> None:
+    """Test identical templates share the compiled template."""
+    template_string = "{{ states('sensor.shared') }} {{ 1 + 2 }}"
+    hass.states.async_set("sensor.shared", "on")
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "on 3"
+    tpl2 = template.Template(template_string, hass)
+    assert tpl2.async_render() == "on 3"
+    assert tpl2._compiled is tpl._compiled
+
+    stats = template.async_get_cache_stats(hass)["default"]
+    assert stats["compiled_templates"] >= 1
+    assert stats["bound_templates"] >= 1
+    assert stats["compile_hits"] >= 1
+    assert stats["bind_hits"] >= 1
+
+    env = tpl._env
+    del tpl
+    gc.collect()
+    assert env.bound_template_cache.get(template_string)
+    del tpl2
+    # Bound templates reference themselves through their render functions
+    gc.collect()
+    assert not env.bound_template_cache.get(template_string)
+    assert not env.template_cache.get(template_string)
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 import logging
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 import urllib.error
 
 import aiohttp
@@ -747,3 +747,87 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_adaptive_polling(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test adaptive polling backs off unchanged data and tightens on changes."""
+    entry = MockConfigEntry(domain="test")
+    entry.add_to_hass(hass)
+    config_entries.current_entry.set(entry)
+    data = {"a": 1}
+    polls = 0
+
+    async def refresh() -> dict[str, int]:
+        nonlocal polls
+        polls += 1
+        return dict(data)
+
+    crd = update_coordinator.DataUpdateCoordinator[dict[str, int]](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        always_update=False,
+        adaptive_polling=update_coordinator.AdaptivePolling(
+            max_interval=timedelta(seconds=40), min_change_rate=0.9
+        ),
+    )
+
+    async def tick(seconds: float) -> None:
+        freezer.tick(timedelta(seconds=seconds + 0.1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.update_coordinator.uniform",
+        lambda low, high: (low + high) / 2,
+    ):
+        await crd.async_refresh()
+        unsub = crd.async_add_listener(Mock())
+        assert polls == 1
+
+        # Unchanged data backs off up to the max interval
+        await tick(10)
+        assert polls == 2
+        await tick(10)
+        assert polls == 2
+        await tick(10)
+        assert polls == 3
+        await tick(39)
+        assert polls == 3
+        await tick(1)
+        assert polls == 4
+        await tick(40)
+        assert polls == 5
+
+        # Changed data tightens the interval again
+        data["a"] = 2
+        await tick(40)
+        assert polls == 6
+        await tick(10)
+        assert polls == 7
+
+    assert update_coordinator.async_get_adaptive_polling_diagnostics(
+        hass, entry.entry_id
+    ) == [
+        {
+            "name": "test",
+            "update_interval": 10.0,
+            "current_interval": 20.0,
+            "change_rate": 0.365,
+            "polls": 6,
+            "skipped_polls": 10,
+            "average_update_seconds": ANY,
+            "saved_update_seconds": ANY,
+        }
+    ]
+
+    unsub()
+    await crd.async_shutdown()
+    assert (
+        update_coordinator.async_get_adaptive_polling_diagnostics(hass, entry.entry_id)
+        == []
+    )
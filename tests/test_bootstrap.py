@@ -15,13 +15,14 @@ import pytest
 from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DEBUG, SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import CONF_DEBUG, SIGNAL_BOOTSTRAP_INTEGRATIONS, __version__
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.requirements import RequirementsNotFound
 from homeassistant.setup import BASE_PLATFORMS
 
 from .common import (
@@ -548,6 +549,172 @@ async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     assert "second_dep" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_integration_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the resolved integrations are stored and used on the next start."""
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(
+        hass,
+        MockModule(
+            domain="first_dep",
+            partial_manifest={"after_dependencies": ["root"]},
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="second_dep",
+            partial_manifest={"dependencies": ["first_dep"]},
+        ),
+    )
+    config = {"second_dep": {}}
+
+    with caplog.at_level(logging.INFO):
+        await bootstrap._async_resolve_domains_to_setup(hass, config)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert "without the integration snapshot" in caplog.text
+
+    snapshot = hass_storage[bootstrap.INTEGRATION_SNAPSHOT_STORAGE_KEY]["data"]
+    assert snapshot["ha_version"] == __version__
+    assert "second_dep" in snapshot["requested"]
+    assert "first_dep" not in snapshot["requested"]
+    assert {"root", "first_dep", "second_dep"}.issubset(snapshot["domains"])
+
+    caplog.clear()
+    with (
+        caplog.at_level(logging.INFO),
+        patch.object(
+            bootstrap.loader,
+            "async_get_integrations",
+            wraps=loader.async_get_integrations,
+        ) as mock_get_integrations,
+    ):
+        await bootstrap._async_resolve_domains_to_setup(hass, {"second_dep": {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert "with the integration snapshot" in caplog.text
+    assert mock_get_integrations.mock_calls[0][1][1] == snapshot["domains"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+@pytest.mark.parametrize(
+    "snapshot",
+    [
+        ["second_dep"],
+        {"ha_version": __version__, "requested": ["second_dep"]},
+        {"ha_version": __version__, "requested": ["second_dep"], "domains": "root"},
+        {"ha_version": __version__, "requested": ["second_dep"], "domains": [1]},
+    ],
+)
+async def test_invalid_integration_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+    snapshot: Any,
+) -> None:
+    """Test an invalid integration snapshot falls back to a normal scan."""
+    mock_integration(hass, MockModule(domain="second_dep"))
+    hass_storage[bootstrap.INTEGRATION_SNAPSHOT_STORAGE_KEY] = {
+        "version": bootstrap.INTEGRATION_SNAPSHOT_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": bootstrap.INTEGRATION_SNAPSHOT_STORAGE_KEY,
+        "data": snapshot,
+    }
+
+    with caplog.at_level(logging.INFO):
+        domains_to_setup, _ = await bootstrap._async_resolve_domains_to_setup(
+            hass, {"second_dep": {}}
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert "second_dep" in domains_to_setup
+    assert "without the integration snapshot" in caplog.text
+
+
+async def test_imports_started_by_cost(hass: HomeAssistant) -> None:
+    """Test integrations imported on the previous start are imported by cost."""
+    order = []
+
+    async def mock_process_requirements(
+        hass: HomeAssistant, name: str, requirements: list[str]
+    ) -> None:
+        if requirements:
+            raise RequirementsNotFound(name, requirements)
+
+    def mock_integration_import(domain: str, import_executor: bool = True) -> Mock:
+        async def async_get_component():
+            order.append(domain)
+            if domain == "broken":
+                raise ImportError
+
+        return Mock(
+            domain=domain,
+            import_executor=import_executor,
+            requirements=["missing==1.0"] if domain == "missing_req" else [],
+            async_get_component=async_get_component,
+        )
+
+    with patch.object(
+        bootstrap.requirements,
+        "async_process_requirements",
+        side_effect=mock_process_requirements,
+    ):
+        bootstrap._async_start_imports_by_cost(
+            hass,
+            [
+                mock_integration_import("fast"),
+                mock_integration_import("missing_req"),
+                mock_integration_import("slow"),
+                mock_integration_import("broken"),
+                mock_integration_import("new"),
+                mock_integration_import("event_loop", import_executor=False),
+            ],
+            {
+                "fast": 0.1,
+                "missing_req": 5.0,
+                "slow": 2.0,
+                "broken": 1.0,
+                "event_loop": 3.0,
+            },
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert order == ["slow", "broken", "fast"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+@pytest.mark.parametrize(
+    "stored_timings",
+    [
+        ["root"],
+        {"ha_version": __version__},
+        {"ha_version": __version__, "timings": ["root"]},
+        {"ha_version": __version__, "timings": {"root": "slow"}},
+        {"ha_version": __version__, "timings": {"root": None}},
+    ],
+)
+async def test_invalid_import_timings(
+    hass: HomeAssistant, hass_storage: dict[str, Any], stored_timings: Any
+) -> None:
+    """Test invalid stored import timings do not stop the setup."""
+    mock_integration(hass, MockModule(domain="root"))
+    hass_storage[bootstrap.IMPORT_TIMINGS_STORAGE_KEY] = {
+        "version": bootstrap.IMPORT_TIMINGS_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": bootstrap.IMPORT_TIMINGS_STORAGE_KEY,
+        "data": stored_timings,
+    }
+
+    await bootstrap._async_set_up_integrations(hass, {"root": {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert "root" in hass.config.components
+    stored = hass_storage[bootstrap.IMPORT_TIMINGS_STORAGE_KEY]["data"]
+    assert stored["ha_version"] == __version__
+    assert isinstance(stored["timings"], dict)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when referenced integration doesn't exist."""
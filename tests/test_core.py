@@ -59,7 +59,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     ServiceValidationError,
 )
-from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
@@ -1441,6 +1441,50 @@ async def test_statemachine_is_state(hass: HomeAssistant) -> None:
     assert not hass.states.is_state("light.Non_existing", "on")
 
 
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test equal attributes and their JSON are shared between states."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.attributes is state_two.attributes
+
+    # Equal values of different types are not shared
+    hass.states.async_set("sensor.int", "1", {"value": 1})
+    hass.states.async_set("sensor.float", "1", {"value": 1.0})
+    hass.states.async_set("sensor.bool", "1", {"value": True})
+    for entity_id, value_type in (
+        ("sensor.int", int),
+        ("sensor.float", float),
+        ("sensor.bool", bool),
+    ):
+        assert type(hass.states.get(entity_id).attributes["value"]) is value_type
+
+    hass.states.async_set("sensor.three", "3", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.four", "4", {"options": ["a", "b"]})
+    state_three = hass.states.get("sensor.three")
+    state_four = hass.states.get("sensor.four")
+    assert state_three.attributes == state_four.attributes
+    assert state_three.attributes is not state_four.attributes
+
+    assert state_one.as_dict_json == json_bytes(state_one.as_dict())
+    hass.states.async_set("sensor.one", "5", {"unit_of_measurement": "W"})
+    new_state_one = hass.states.get("sensor.one")
+    assert new_state_one.attributes is state_one.attributes
+    assert (
+        new_state_one._attributes_json_fragment is state_one._attributes_json_fragment
+    )
+    assert new_state_one.as_dict_json == json_bytes(new_state_one.as_dict())
+    assert (
+        new_state_one.as_compressed_state_json
+        == (json_bytes({"sensor.one": new_state_one.as_compressed_state})[1:-1])
+    )
+
+    hass.states.async_set("sensor.one", "5", {"unit_of_measurement": "kW"})
+    assert hass.states.get("sensor.one").attributes == {"unit_of_measurement": "kW"}
+    assert "_attributes_json_fragment" not in hass.states.get("sensor.one").__dict__
+
+
 async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     """Test async_entity_ids method."""
     assert hass.states.async_entity_ids() == []
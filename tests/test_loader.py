@@ -1352,6 +1352,7 @@ async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     assert integration.pkg_path == "custom_components.test_package_loaded_executor"
     assert integration.import_executor is True
     assert integration.config_flow is True
+    assert integration.import_seconds is None
 
     assert "test_package_loaded_executor" not in hass.config.components
     assert "test_package_loaded_executor.config_flow" not in hass.config.components
@@ -1385,6 +1386,7 @@ async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     assert "loaded_executor=True" in caplog.text
     assert "loaded_executor=False" not in caplog.text
     assert module is module_mock
+    assert integration.import_seconds is not None
     caplog.clear()
 
     with (
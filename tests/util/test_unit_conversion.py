@@ -672,6 +672,33 @@ def test_unit_conversion_factory(
     )
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "expected", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, value, from_unit, expected, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, expected, to_unit in item
+    ],
+)
+def test_unit_conversion_many(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    expected: float,
+    to_unit: str,
+) -> None:
+    """Test converting many values matches converting them one by one."""
+    convert = converter.converter_factory(from_unit, to_unit)
+    values = [value, value * 2, 0]
+    assert converter.convert_many(values, from_unit, to_unit) == [
+        convert(val) for val in values
+    ]
+    assert converter.convert_many(values, from_unit, to_unit)[0] == pytest.approx(
+        expected
+    )
+
+
 def test_unit_conversion_factory_allow_none_with_none() -> None:
     """Test test_unit_conversion_factory_allow_none with None."""
     assert (